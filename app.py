@@ -454,31 +454,25 @@ def products():
         # Get all products
         products_list = product_service.list_all_products()
 
-        # Calculate CORRECT margins for each product
-        for product in products_list:
-            custo = float(product.get('CUSTO', 0))
-            valor = float(product.get('VALOR', 0))
-
-            if valor > 0:
-                # USA O MÉTODO CORRETO (não depende de monthly_sales)
-                margin_data = expense_service.calculate_product_margin(
-                    sale_price=valor,
-                    cost_price=custo,
-                    quantity=1,
-                    payment_method='pix'  # Assume pix por padrão
-                )
-
-                product['gross_margin_pct'] = margin_data['gross_margin_pct']
-                product['contribution_margin_pct'] = margin_data['contribution_margin_pct']
-                product['variable_costs'] = margin_data['variable_costs_total']
-
-                # Para compatibilidade com template antigo
-                product['net_margin_pct'] = margin_data['contribution_margin_pct']
-            else:
-                product['gross_margin_pct'] = 0
-                product['contribution_margin_pct'] = 0
-                product['net_margin_pct'] = 0
-                product['variable_costs'] = 0
+        # Calculate CORRECT margins for all products at once (NumPy, config
+        # de custos lida uma vez); mesmo cálculo de calculate_product_margin
+        margins = expense_service.calculate_product_margins(
+            sale_prices=[float(p.get('VALOR', 0)) for p in products_list],
+            cost_prices=[float(p.get('CUSTO', 0)) for p in products_list],
+            payment_method='pix'  # Assume pix por padrão
+        )
+        for product, gross, contribution, variable in zip(
+            products_list,
+            margins['gross_margin_pct'].tolist(),
+            margins['contribution_margin_pct'].tolist(),
+            margins['variable_costs_total'].tolist()
+        ):
+            product['gross_margin_pct'] = gross
+            product['contribution_margin_pct'] = contribution
+            product['variable_costs'] = variable
+
+            # Para compatibilidade com template antigo
+            product['net_margin_pct'] = contribution
 
         return render_template(
             'products.html', 
@@ -2227,28 +2221,26 @@ def api_avg_ticket_trend():
     """Ticket médio mensal."""
     try:
         from src.repositories.sale_repository import SaleRepository
-        import pandas as pd
         
         sale_repo = SaleRepository()
-        sales_df = sale_repo.get_all()
+        # Só as colunas usadas abaixo saem do banco, já tipadas
+        sales_df = sale_repo.get_all(columns=['DATA', 'VALOR_TOTAL_VENDA'],
+                                     dtype={'VALOR_TOTAL_VENDA': 'float64'},
+                                     parse_dates=['DATA'])
         
         if sales_df.empty:
             return jsonify({'success': True, 'data': {'months': [], 'tickets': []}})
         
-        # Convert dates (flexible parsing)
+        # DATA já chega como datetime64 (ISO ou DD/MM/YYYY; inválidas = NaT)
         print(f"[ANALYTICS] avg_ticket_trend: sales rows={len(sales_df)}")
-        sales_df['DATA_DT'] = pd.to_datetime(sales_df['DATA'], format='%d/%m/%Y', errors='coerce')
-        mask = sales_df['DATA_DT'].isna()
-        if mask.any():
-            sales_df.loc[mask, 'DATA_DT'] = sales_df.loc[mask, 'DATA'].apply(lambda s: pd.to_datetime(s, format='%Y-%m-%d', errors='coerce'))
-        sales_df = sales_df[sales_df['DATA_DT'].notna()]
-        sales_df['MONTH_KEY'] = sales_df['DATA_DT'].dt.strftime('%Y-%m')
-        sales_df['VALOR_TOTAL_VENDA'] = pd.to_numeric(sales_df['VALOR_TOTAL_VENDA'], errors='coerce').fillna(0)
+        sales_df = sales_df[sales_df['DATA'].notna()]
+        sales_df['MONTH_KEY'] = sales_df['DATA'].dt.strftime('%Y-%m')
+        sales_df['VALOR_TOTAL_VENDA'] = sales_df['VALOR_TOTAL_VENDA'].fillna(0)
         
         # Get last 12 months
         end_date = datetime.now()
         start_date = end_date - timedelta(days=365)
-        sales_df = sales_df[sales_df['DATA_DT'] >= start_date]
+        sales_df = sales_df[sales_df['DATA'] >= start_date]
         
         # Calculate avg ticket per month
         monthly_avg = sales_df.groupby('MONTH_KEY')['VALOR_TOTAL_VENDA'].mean().to_dict()
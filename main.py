@@ -471,17 +471,22 @@ class PerfumeryApp:
     def sales_summary(self):
         """Display sales summary."""
         print_section_header("RESUMO DE VENDAS")
-        self.sale_service.get_sales_summary()
+        summary = self.sale_service.get_sales_summary()
+        print(self.sale_service.format_summary(summary))
     
     def top_products(self):
         """Display top products."""
         print_section_header("TOP PRODUTOS")
-        self.sale_service.get_top_products(limit=10)
+        products = self.sale_service.get_top_products(limit=10)
+        if products:
+            print(self.sale_service.format_top_products(products))
     
     def top_clients(self):
         """Display top clients."""
         print_section_header("TOP CLIENTES")
-        self.sale_service.get_top_clients(limit=10)
+        clients = self.sale_service.get_top_clients(limit=10)
+        if clients:
+            print(self.sale_service.format_top_clients(clients))
     
     def client_stats(self):
         """Display client statistics."""
@@ -2,10 +2,11 @@
 Sale model with validation - UPDATED with new payment methods.
 """
 
+import re
+from calendar import monthrange
 from dataclasses import dataclass
 from typing import Optional
 from enum import Enum
-from datetime import datetime
 
 
 class MeioPagamento(str, Enum):
@@ -20,6 +21,30 @@ class MeioPagamento(str, Enum):
     CREDIARIO = "crediário"
 
 
+# Valores do enum expandidos uma única vez (o enum não muda em runtime)
+PAYMENT_METHODS = tuple(m.value for m in MeioPagamento)
+# Mesmos valores para o teste de pertinência (hash O(1)); a tupla fica
+# para exibição, na ordem do enum
+_PAYMENT_METHOD_SET = frozenset(PAYMENT_METHODS)
+
+# DD/MM/YYYY (dia/mês com 1 ou 2 dígitos, como o strptime aceita)
+_DATE_RE = re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4})')
+
+
+def is_valid_sale_date(data: str) -> bool:
+    """
+    Check a DD/MM/YYYY date without datetime.strptime.
+    
+    Regex pré-compilada + checagem de calendário (31/02 é rejeitado),
+    mesmo resultado do strptime com bem menos custo por chamada.
+    """
+    match = _DATE_RE.fullmatch(data)
+    if not match:
+        return False
+    day, month, year = int(match.group(1)), int(match.group(2)), int(match.group(3))
+    return 1 <= month <= 12 and year >= 1 and 1 <= day <= monthrange(year, month)[1]
+
+
 @dataclass
 class Sale:
     """
@@ -50,12 +75,11 @@ class Sale:
         
         # Validate payment method
         meio_lower = self.meio.lower().strip()
-        valid_methods = [m.value for m in MeioPagamento]
         
-        if meio_lower not in valid_methods:
+        if meio_lower not in _PAYMENT_METHOD_SET:
             raise ValueError(
                 f"Meio de pagamento inválido. "
-                f"Opções: {', '.join(valid_methods)}"
+                f"Opções: {', '.join(PAYMENT_METHODS)}"
             )
         
         # Normalize payment method
@@ -65,10 +89,7 @@ class Sale:
         if not self.data:
             raise ValueError("Data da venda é obrigatória")
         
-        try:
-            # Try to parse the date to validate format
-            datetime.strptime(self.data, '%d/%m/%Y')
-        except ValueError:
+        if not is_valid_sale_date(self.data):
             raise ValueError("Data inválida. Use o formato DD/MM/YYYY")
         
         # Validate total value
@@ -11,6 +11,7 @@ Mudanças principais:
 from __future__ import annotations
 
 import os
+import threading
 from typing import Optional, List, Dict, Any
 from pathlib import Path
 from contextlib import contextmanager
@@ -18,6 +19,13 @@ from contextlib import contextmanager
 # Determine database type from environment
 DB_TYPE = os.getenv('DB_TYPE', 'sqlite').lower()
 
+# Mensagens [DB DEBUG] a cada consulta (find_all, checagem de tabela). Por
+# padrão desligadas: são 1-2 writes no stdout por leitura, em toda listagem
+DB_DEBUG = os.getenv('DB_DEBUG', 'false').lower() in ('1', 'true', 'yes')
+
+# Conexão ativa por thread enquanto um bloco transaction() estiver aberto
+_tx_local = threading.local()
+
 
 class BaseRepository:
     """Base repository com suporte a SQLite e PostgreSQL otimizado."""
@@ -37,7 +45,14 @@ class BaseRepository:
         
         IMPORTANTE: Usa o mesmo pool connection durante todo o bloco.
         Commit/rollback é automático.
+        
+        Dentro de transaction() reutiliza a conexão da transação e deixa
+        o commit/rollback para o final do bloco externo.
         """
+        if self._in_transaction():
+            yield _tx_local.conn
+            return
+        
         if self.db_type == 'postgresql':
             from src.database.postgres_connection import get_connection
             
@@ -56,6 +71,44 @@ class BaseRepository:
             finally:
                 conn.close()
 
+    @contextmanager
+    def transaction(self):
+        """
+        Agrupa várias operações em uma única transação no banco.
+        
+        Vale para qualquer repositório: todas as chamadas a get_conn()
+        feitas na mesma thread dentro do bloco usam a mesma conexão.
+        Commit acontece uma vez no final; qualquer exceção faz rollback
+        de tudo. Blocos aninhados participam da transação externa.
+        
+        No SQLite a transação começa com BEGIN IMMEDIATE: o lock de escrita
+        é obtido já na entrada, então outro escritor não consegue intercalar
+        gravações no meio do bloco (nem falhar com "database is locked"
+        depois que parte das escritas já foi feita).
+        
+        Uso:
+            with sale_repo.transaction():
+                sale_repo.save(sale)
+                item_repo.save_many(items)
+        """
+        if self._in_transaction():
+            yield
+            return
+        
+        with self.get_conn() as conn:
+            if self.db_type != 'postgresql' and not conn.in_transaction:
+                conn.execute('BEGIN IMMEDIATE')
+            _tx_local.conn = conn
+            try:
+                yield
+            finally:
+                _tx_local.conn = None
+
+    @staticmethod
+    def _in_transaction() -> bool:
+        """True se a thread atual está dentro de um bloco transaction()."""
+        return getattr(_tx_local, 'conn', None) is not None
+
     def _get_cursor(self, conn):
         """Retorna cursor apropriado para o tipo de banco."""
         if self.db_type == 'postgresql':
@@ -92,7 +145,8 @@ class BaseRepository:
                 )
                 result = cur.fetchone()
                 exists = bool(result['exists'] if isinstance(result, dict) else result[0])
-                print(f"[DB DEBUG] Tabela '{self.table_name}' existe: {exists}")
+                if DB_DEBUG:
+                    print(f"[DB DEBUG] Tabela '{self.table_name}' existe: {exists}")
                 return exists
             else:
                 cur.execute(
@@ -124,7 +178,8 @@ class BaseRepository:
             query = f'SELECT {cols} FROM {self._quote_identifier(self.table_name)}'
             cur.execute(query)
             rows = cur.fetchall()
-            print(f"[DB DEBUG] find_all('{self.table_name}') retornou {len(rows)} linhas")
+            if DB_DEBUG:
+                print(f"[DB DEBUG] find_all('{self.table_name}') retornou {len(rows)} linhas")
             return [dict(r) for r in rows]
 
     def find_by_id(self, pk_value: Any) -> Optional[Dict[str, Any]]:
@@ -255,16 +310,52 @@ class BaseRepository:
 
     # ------------------ Legacy Compatibility (DEPRECATED) ------------------
     
-    def get_all(self):
+    def get_all(self, columns: Optional[List[str]] = None,
+                dtype: Optional[Dict[str, str]] = None,
+                parse_dates: Optional[List[str]] = None):
         """
         DEPRECATED: Usa find_all() para evitar Pandas.
         
         Mantido apenas para compatibilidade com código legado.
+        
+        Args:
+            columns: Projeção repassada a find_all() (só essas colunas
+                saem do banco). Se None, todas.
+            dtype: {coluna: tipo} aplicado na montagem do DataFrame (como
+                no read_csv), ex. {'VALOR_TOTAL_VENDA': 'float64'}. Tipos
+                numéricos passam por pd.to_numeric(errors='coerce'): valores
+                vazios ou não numéricos viram NaN em vez de levantar erro
+                (colunas inteiras com NaN ficam float64).
+            parse_dates: Colunas convertidas para datetime64 na montagem.
+                Aceita ISO (YYYY-MM-DD, formato gravado) e o legado
+                DD/MM/YYYY; valores inválidos viram NaT.
         """
         import pandas as pd
         
-        rows = self.find_all()
+        rows = self.find_all(columns)
         if not rows:
-            return pd.DataFrame(columns=self.schema)
+            df = pd.DataFrame(columns=columns or self.schema)
+        else:
+            df = pd.DataFrame(rows)
+        
+        # Conversões feitas uma vez aqui, em vez de em cada chamador
+        for col, tipo in (dtype or {}).items():
+            if col not in df.columns:
+                continue
+            if pd.api.types.is_numeric_dtype(pd.api.types.pandas_dtype(tipo)):
+                values = pd.to_numeric(df[col], errors='coerce')
+                if values.isna().any() and pd.api.types.is_integer_dtype(pd.api.types.pandas_dtype(tipo)):
+                    df[col] = values.astype('float64')
+                else:
+                    df[col] = values.astype(tipo)
+            else:
+                df[col] = df[col].astype(tipo)
+        for col in parse_dates or ():
+            if col in df.columns:
+                raw = df[col]
+                parsed = pd.to_datetime(raw, format='%Y-%m-%d', errors='coerce')
+                if parsed.isna().any():
+                    parsed = parsed.fillna(pd.to_datetime(raw, format='%d/%m/%Y', errors='coerce'))
+                df[col] = parsed.astype('datetime64[ns]')
         
-        return pd.DataFrame(rows)
\ No newline at end of file
+        return df
\ No newline at end of file
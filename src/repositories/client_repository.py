@@ -7,6 +7,7 @@ import pandas as pd
 from typing import Optional, List, Dict
 from src.repositories.base_repository import BaseRepository
 from src.models.client import Client, CLIENT_SCHEMA
+from src.validators.client_validator import digits_only
 
 
 class ClientRepository(BaseRepository):
@@ -53,13 +54,12 @@ class ClientRepository(BaseRepository):
     def get_by_cpf_cnpj(self, cpf_cnpj: str) -> Optional[Dict]:
         if not cpf_cnpj:
             return None
-        import re
-        search_value = re.sub(r'[^0-9]', '', cpf_cnpj)
+        search_value = digits_only(cpf_cnpj)
         with self.get_conn() as conn:
             cur = self._get_cursor(conn)
             cur.execute('SELECT * FROM clients WHERE "CPF_CNPJ" IS NOT NULL')
             for row in cur.fetchall():
-                db_value = re.sub(r'[^0-9]', '', str(row.get('CPF_CNPJ', '') or ''))
+                db_value = digits_only(str(row.get('CPF_CNPJ', '') or ''))
                 if db_value == search_value:
                     return dict(row)
         return None
@@ -83,6 +83,52 @@ class ClientRepository(BaseRepository):
         except Exception as e:
             raise Exception(f"Erro ao salvar cliente: {str(e)}")
 
+    def save_many(self, clients: List[Client]) -> bool:
+        """
+        Salva vários clientes de uma vez (importações).
+        
+        Mesmas regras de save() (ID e CPF/CNPJ únicos, inclusive dentro do
+        próprio lote), mas com 1 SELECT para as checagens e 1 executemany
+        para os INSERTs, em vez de consultas por cliente.
+        """
+        if not clients:
+            return True
+        
+        existing = self.find_all(columns=['ID_CLIENTE', 'CLIENTE', 'CPF_CNPJ'])
+        ids = {str(r['ID_CLIENTE']) for r in existing}
+        by_doc = {}
+        for r in existing:
+            doc = digits_only(str(r.get('CPF_CNPJ', '') or ''))
+            if doc:
+                by_doc.setdefault(doc, r)
+        
+        rows = []
+        for client in clients:
+            data = client.to_dict()
+            if data['ID_CLIENTE'] in ids:
+                raise ValueError(f"Cliente com ID '{client.id_cliente}' já existe")
+            doc = digits_only(data['CPF_CNPJ'])
+            if doc:
+                other = by_doc.get(doc)
+                if other:
+                    raise ValueError(
+                        f"CPF/CNPJ '{client.cpf_cnpj}' já cadastrado para "
+                        f"cliente '{other['CLIENTE']}' (ID: {other['ID_CLIENTE']})"
+                    )
+                by_doc[doc] = data
+            ids.add(data['ID_CLIENTE'])
+            rows.append(tuple(self._normalize_value(data[c]) for c in CLIENT_SCHEMA))
+        
+        cols = ','.join(self._quote_identifier(c) for c in CLIENT_SCHEMA)
+        sql = f'INSERT INTO clients ({cols}) VALUES ({self._placeholder(len(CLIENT_SCHEMA))})'
+        try:
+            with self.get_conn() as conn:
+                cur = self._get_cursor(conn)
+                cur.executemany(sql, rows)
+            return True
+        except Exception as e:
+            raise Exception(f"Erro ao salvar clientes: {str(e)}")
+
     def update(self, id_cliente: str, updates: Dict) -> bool:
         if not self.exists(id_cliente):
             raise ValueError(f"Cliente com ID '{id_cliente}' não encontrado")
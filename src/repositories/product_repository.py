@@ -12,6 +12,16 @@ from src.repositories.base_repository import BaseRepository
 from src.models.product import Product, PRODUCT_SCHEMA
 
 
+# Projeção com tipos já resolvidos no banco (NUMERIC vira Decimal no
+# PostgreSQL): quem consome não precisa de int()/float() por linha.
+TYPED_PRODUCT_COLUMNS = '''
+    "CODIGO", "PRODUTO", "CATEGORIA",
+    CAST(COALESCE("CUSTO", 0) AS DOUBLE PRECISION) AS "CUSTO",
+    CAST(COALESCE("VALOR", 0) AS DOUBLE PRECISION) AS "VALOR",
+    CAST(COALESCE("ESTOQUE", 0) AS INTEGER) AS "ESTOQUE"
+'''
+
+
 class ProductRepository(BaseRepository):
     """Repository otimizado para produtos."""
 
@@ -47,19 +57,60 @@ class ProductRepository(BaseRepository):
             row = cur.fetchone()
             return dict(row) if row else None
 
+    def find_all_typed(self) -> List[Dict]:
+        """
+        OTIMIZADO: Retorna todos os produtos com CUSTO/VALOR (float) e
+        ESTOQUE (int) já convertidos no SQL.
+        """
+        if not self._table_exists():
+            return []
+        with self.get_conn() as conn:
+            cur = self._get_cursor(conn)
+            cur.execute(f'SELECT {TYPED_PRODUCT_COLUMNS} FROM products')
+            return [dict(r) for r in cur.fetchall()]
+
+    def get_by_codigos(self, codigos: List[str]) -> Dict[str, Dict]:
+        """
+        OTIMIZADO: Busca vários produtos em 1 query (IN).
+        
+        Returns:
+            Dict CODIGO (maiúsculo) -> linha do produto, com VALOR/CUSTO
+            float e ESTOQUE int. Códigos inexistentes simplesmente não
+            aparecem no resultado.
+        """
+        keys = list(dict.fromkeys(str(c).strip().upper() for c in codigos if c))
+        if not keys:
+            return {}
+        
+        with self.get_conn() as conn:
+            cur = self._get_cursor(conn)
+            placeholders = self._placeholder(len(keys))
+            
+            if self.db_type == 'postgresql':
+                cur.execute(f'SELECT {TYPED_PRODUCT_COLUMNS} FROM products WHERE UPPER("CODIGO") IN ({placeholders})', keys)
+            else:
+                cur.execute(f'SELECT {TYPED_PRODUCT_COLUMNS} FROM products WHERE "CODIGO" COLLATE NOCASE IN ({placeholders})', keys)
+            
+            return {str(r['CODIGO']).upper(): dict(r) for r in cur.fetchall()}
+
+    @staticmethod
+    def _to_row(product: Product) -> Dict:
+        """Linha normalizada do produto, como gravada no banco."""
+        return {
+            'CODIGO': product.codigo.strip().upper(),
+            'PRODUTO': product.produto.strip().title(),
+            'CATEGORIA': product.categoria.strip().title(),
+            'CUSTO': float(f"{product.custo:.2f}"),
+            'VALOR': float(f"{product.valor:.2f}"),
+            'ESTOQUE': int(product.estoque)
+        }
+
     def save(self, product: Product) -> bool:
         if self.exists(product.codigo):
             raise ValueError(f"Produto com código '{product.codigo}' já existe")
         
         try:
-            data = {
-                'CODIGO': product.codigo.strip().upper(),
-                'PRODUTO': product.produto.strip().title(),
-                'CATEGORIA': product.categoria.strip().title(),
-                'CUSTO': float(f"{product.custo:.2f}"),
-                'VALOR': float(f"{product.valor:.2f}"),
-                'ESTOQUE': int(product.estoque)
-            }
+            data = self._to_row(product)
             self.insert(data)
             return True
         except ValueError:
@@ -67,6 +118,33 @@ class ProductRepository(BaseRepository):
         except Exception as e:
             raise Exception(f"Erro ao salvar produto: {str(e)}")
 
+    def save_many(self, products: List[Product]) -> bool:
+        """
+        OTIMIZADO: Salva vários produtos com 1 SELECT (códigos já
+        existentes, via get_by_codigos) + 1 executemany.
+        
+        Mesma regra de save(): código único, inclusive dentro do lote.
+        """
+        if not products:
+            return True
+        
+        rows = [self._to_row(p) for p in products]
+        taken = set(self.get_by_codigos([r['CODIGO'] for r in rows]))
+        for product, row in zip(products, rows):
+            if row['CODIGO'] in taken:
+                raise ValueError(f"Produto com código '{product.codigo}' já existe")
+            taken.add(row['CODIGO'])
+        
+        cols = ','.join(self._quote_identifier(c) for c in PRODUCT_SCHEMA)
+        sql = f'INSERT INTO products ({cols}) VALUES ({self._placeholder(len(PRODUCT_SCHEMA))})'
+        try:
+            with self.get_conn() as conn:
+                cur = self._get_cursor(conn)
+                cur.executemany(sql, [tuple(r[c] for c in PRODUCT_SCHEMA) for r in rows])
+            return True
+        except Exception as e:
+            raise Exception(f"Erro ao salvar produtos: {str(e)}")
+
     def update(self, codigo: str, updates: Dict) -> bool:
         if not self.exists(codigo):
             raise ValueError(f"Produto com código '{codigo}' não encontrado")
@@ -169,6 +247,67 @@ class ProductRepository(BaseRepository):
         except Exception as e:
             raise Exception(f"Erro ao atualizar estoque: {str(e)}")
 
+    def update_stock_many(self, changes: Dict[str, int]) -> bool:
+        """
+        OTIMIZADO: Aplica vários ajustes de estoque com 1 SELECT + 1 executemany.
+        
+        Tudo ou nada: se algum produto não existir ou ficar com estoque
+        negativo, nenhum estoque é alterado.
+        
+        Args:
+            changes: Dict codigo -> variação de quantidade (+ entrada / - saída)
+        """
+        deltas: Dict[str, int] = {}
+        for codigo, change in changes.items():
+            key = str(codigo).strip().upper()
+            deltas[key] = deltas.get(key, 0) + int(change)
+        if not deltas:
+            return True
+        
+        try:
+            with self.get_conn() as conn:
+                cur = self._get_cursor(conn)
+                keys = list(deltas)
+                placeholders = self._placeholder(len(keys))
+                
+                if self.db_type == 'postgresql':
+                    cur.execute(f'''
+                        SELECT "CODIGO", "ESTOQUE" FROM products
+                        WHERE UPPER("CODIGO") IN ({placeholders})
+                        FOR UPDATE
+                    ''', keys)
+                else:
+                    cur.execute(f'''
+                        SELECT "CODIGO", "ESTOQUE" FROM products
+                        WHERE "CODIGO" COLLATE NOCASE IN ({placeholders})
+                    ''', keys)
+                
+                stocks = {str(r['CODIGO']).upper(): int(r['ESTOQUE'] or 0) for r in cur.fetchall()}
+                
+                params = []
+                for key, delta in deltas.items():
+                    if key not in stocks:
+                        raise ValueError(f"Produto com código '{key}' não encontrado")
+                    new_stock = stocks[key] + delta
+                    if new_stock < 0:
+                        raise ValueError(
+                            f"Estoque insuficiente para '{key}'. Disponível: {stocks[key]} unidades"
+                        )
+                    params.append((new_stock, key))
+                
+                if self.db_type == 'postgresql':
+                    sql = 'UPDATE products SET "ESTOQUE" = %s WHERE UPPER("CODIGO") = %s'
+                else:
+                    sql = 'UPDATE products SET "ESTOQUE" = ? WHERE "CODIGO" = ? COLLATE NOCASE'
+                cur.executemany(sql, params)
+                
+                return True
+                
+        except ValueError:
+            raise
+        except Exception as e:
+            raise Exception(f"Erro ao atualizar estoque: {str(e)}")
+
     def get_by_category(self, categoria: str) -> List[Dict]:
         if not categoria:
             return []
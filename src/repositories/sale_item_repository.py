@@ -7,11 +7,20 @@ Principais otimizações:
 3. Batch inserts otimizados
 """
 
-from typing import List, Dict
+from typing import List, Dict, Sequence
 from src.repositories.base_repository import BaseRepository
 from src.models.sale_item import SaleItem, SALE_ITEM_SCHEMA
 
 
+# Projeção com colunas numéricas já tipadas pelo banco (evita int()/float() por linha)
+TYPED_ITEM_COLUMNS = '''
+    "ID_VENDA", "PRODUTO", "CATEGORIA", "CODIGO",
+    CAST(COALESCE("QUANTIDADE", 0) AS INTEGER) AS "QUANTIDADE",
+    CAST(COALESCE("PRECO_UNIT", 0) AS DOUBLE PRECISION) AS "PRECO_UNIT",
+    CAST(COALESCE("PRECO_TOTAL", 0) AS DOUBLE PRECISION) AS "PRECO_TOTAL"
+'''
+
+
 class SaleItemRepository(BaseRepository):
     """Repository otimizado para itens de venda."""
 
@@ -72,12 +81,67 @@ class SaleItemRepository(BaseRepository):
         except Exception as e:
             raise Exception(f"Erro ao salvar itens: {str(e)}")
 
+    def find_all_typed(self) -> List[Dict]:
+        """
+        OTIMIZADO: Retorna todos os itens com QUANTIDADE (int) e
+        PRECO_UNIT/PRECO_TOTAL (float) já convertidos no SQL.
+        """
+        with self.get_conn() as conn:
+            cur = self._get_cursor(conn)
+            cur.execute(f'SELECT {TYPED_ITEM_COLUMNS} FROM sales_items')
+            return [dict(r) for r in cur.fetchall()]
+
+    def find_all_with_sale_rows(self) -> List[Sequence]:
+        """
+        OTIMIZADO: JOIN item + header da venda feito no banco, devolvendo
+        linhas cruas (tuplas, sem dict por linha) já tipadas.
+        
+        Itens órfãos (sem header em sales) ficam de fora pelo INNER JOIN.
+        
+        Ordem das colunas (igual a SaleRecord): ID_VENDA, DATA, CLIENTE,
+        ID_CLIENTE, PRODUTO, CODIGO, CATEGORIA, QUANTIDADE, PRECO_UNIT,
+        PRECO_TOTAL, MEIO, VALOR_TOTAL_VENDA
+        """
+        if not self._table_exists():
+            return []
+        with self.get_conn() as conn:
+            # Cursor simples: tuplas no PostgreSQL, sqlite3.Row (indexável) no SQLite
+            cur = conn.cursor()
+            cur.execute('''
+                SELECT
+                    s."ID_VENDA", s."DATA", s."CLIENTE", s."ID_CLIENTE",
+                    i."PRODUTO", i."CODIGO", i."CATEGORIA",
+                    CAST(COALESCE(i."QUANTIDADE", 0) AS INTEGER),
+                    CAST(COALESCE(i."PRECO_UNIT", 0) AS DOUBLE PRECISION),
+                    CAST(COALESCE(i."PRECO_TOTAL", 0) AS DOUBLE PRECISION),
+                    s."MEIO",
+                    CAST(COALESCE(s."VALOR_TOTAL_VENDA", 0) AS DOUBLE PRECISION)
+                FROM sales_items i
+                INNER JOIN sales s ON s."ID_VENDA" = i."ID_VENDA"
+            ''')
+            return cur.fetchall()
+
     def get_by_sale_id(self, id_venda: str) -> List[Dict]:
-        """Retorna itens de uma venda."""
+        """Retorna itens de uma venda (colunas numéricas já tipadas)."""
         with self.get_conn() as conn:
             cur = self._get_cursor(conn)
             placeholder = '%s' if self.db_type == 'postgresql' else '?'
-            cur.execute(f'SELECT * FROM sales_items WHERE "ID_VENDA" = {placeholder}', (id_venda,))
+            cur.execute(f'SELECT {TYPED_ITEM_COLUMNS} FROM sales_items WHERE "ID_VENDA" = {placeholder}', (id_venda,))
+            return [dict(r) for r in cur.fetchall()]
+
+    def get_by_sale_ids(self, ids_venda: List[str]) -> List[Dict]:
+        """
+        OTIMIZADO: Itens de várias vendas em 1 query (IN), colunas tipadas.
+        """
+        ids = list(dict.fromkeys(ids_venda))
+        if not ids:
+            return []
+        with self.get_conn() as conn:
+            cur = self._get_cursor(conn)
+            cur.execute(
+                f'SELECT {TYPED_ITEM_COLUMNS} FROM sales_items WHERE "ID_VENDA" IN ({self._placeholder(len(ids))})',
+                ids
+            )
             return [dict(r) for r in cur.fetchall()]
 
     def get_by_product(self, codigo: str) -> List[Dict]:
@@ -107,6 +171,22 @@ class SaleItemRepository(BaseRepository):
         except Exception as e:
             raise Exception(f"Erro ao deletar itens: {str(e)}")
 
+    def delete_by_sale_ids(self, ids_venda: List[str]) -> int:
+        """OTIMIZADO: Deleta itens de várias vendas em 1 query. Retorna linhas removidas."""
+        ids = list(dict.fromkeys(ids_venda))
+        if not ids:
+            return 0
+        try:
+            with self.get_conn() as conn:
+                cur = self._get_cursor(conn)
+                cur.execute(
+                    f'DELETE FROM sales_items WHERE "ID_VENDA" IN ({self._placeholder(len(ids))})',
+                    ids
+                )
+                return cur.rowcount
+        except Exception as e:
+            raise Exception(f"Erro ao deletar itens: {str(e)}")
+
     def get_product_stats(self) -> List[Dict]:
         """
         OTIMIZADO: Retorna lista de dicts em vez de Pandas DataFrame.
@@ -12,6 +12,14 @@ from typing import Optional, List, Dict
 from datetime import datetime
 from src.repositories.base_repository import BaseRepository
 from src.models.sale import Sale, SALE_SCHEMA
+from src.utils.id_generator import IDGenerator
+
+
+# Projeção com VALOR_TOTAL_VENDA já tipado pelo banco (evita float() por linha)
+TYPED_SALE_COLUMNS = '''
+    "ID_VENDA", "ID_CLIENTE", "CLIENTE", "MEIO", "DATA",
+    CAST(COALESCE("VALOR_TOTAL_VENDA", 0) AS DOUBLE PRECISION) AS "VALOR_TOTAL_VENDA"
+'''
 
 
 class SaleRepository(BaseRepository):
@@ -29,6 +37,56 @@ class SaleRepository(BaseRepository):
             cur.execute(f'SELECT 1 FROM sales WHERE "ID_VENDA" = {placeholder} LIMIT 1', (id_venda,))
             return cur.fetchone() is not None
 
+    def find_all_typed(self) -> List[Dict]:
+        """
+        OTIMIZADO: Retorna todas as vendas com VALOR_TOTAL_VENDA (float)
+        já convertido no SQL.
+        """
+        if not self._table_exists():
+            return []
+        with self.get_conn() as conn:
+            cur = self._get_cursor(conn)
+            cur.execute(f'SELECT {TYPED_SALE_COLUMNS} FROM sales')
+            return [dict(r) for r in cur.fetchall()]
+
+    def get_max_sale_id(self) -> Optional[str]:
+        """
+        OTIMIZADO: Maior ID_VENDA (formato VND###) calculado com MAX() no SQL,
+        sem trazer todos os IDs para o Python.
+        
+        Returns:
+            ID como 'VND042', ou None se não houver vendas.
+        """
+        if not self._table_exists():
+            return None
+        
+        with self.get_conn() as conn:
+            cur = self._get_cursor(conn)
+            
+            if self.db_type == 'postgresql':
+                cur.execute('''
+                    SELECT MAX(CAST(SUBSTRING(UPPER("ID_VENDA") FROM 4) AS INTEGER)) AS max_num
+                    FROM sales
+                    WHERE UPPER("ID_VENDA") ~ '^VND[0-9]+$'
+                ''')
+            else:
+                cur.execute('''
+                    SELECT MAX(CAST(SUBSTR(UPPER("ID_VENDA"), 4) AS INTEGER)) AS max_num
+                    FROM sales
+                    WHERE UPPER("ID_VENDA") GLOB 'VND[0-9]*'
+                    AND NOT SUBSTR("ID_VENDA", 4) GLOB '*[^0-9]*'
+                ''')
+            
+            row = cur.fetchone()
+            max_num = row['max_num'] if row else None
+        
+        return f"VND{int(max_num):03d}" if max_num is not None else None
+
+    def next_sale_id(self) -> str:
+        """Próximo ID_VENDA disponível (O(1) em relação ao histórico no Python)."""
+        last_id = self.get_max_sale_id()
+        return IDGenerator.generate_sale_id([last_id] if last_id else [])
+
     def get_by_id(self, id_venda: str) -> Optional[Dict]:
         if not id_venda:
             return None
@@ -77,6 +135,25 @@ class SaleRepository(BaseRepository):
             cur.execute(f'SELECT * FROM sales WHERE "ID_CLIENTE" = {placeholder}', (id_cliente,))
             return [dict(r) for r in cur.fetchall()]
 
+    def get_by_product(self, codigo: str) -> List[Dict]:
+        """
+        Retorna vendas que contêm um produto.
+        
+        Filtro resolvido no banco pelos índices de sales_items ("CODIGO")
+        e pela PK de sales, sem varrer as vendas em Python.
+        """
+        if not codigo:
+            return []
+        with self.get_conn() as conn:
+            cur = self._get_cursor(conn)
+            placeholder = '%s' if self.db_type == 'postgresql' else '?'
+            cur.execute(
+                f'SELECT * FROM sales WHERE "ID_VENDA" IN '
+                f'(SELECT "ID_VENDA" FROM sales_items WHERE "CODIGO" = {placeholder})',
+                (str(codigo).strip().upper(),)
+            )
+            return [dict(r) for r in cur.fetchall()]
+
     def get_by_date_range(self, start_date: str, end_date: str) -> List[Dict]:
         """Retorna vendas em um período."""
         def to_iso(s):
@@ -183,8 +260,8 @@ class SaleRepository(BaseRepository):
                 SELECT 
                     "ID_CLIENTE", 
                     "CLIENTE",
-                    COUNT("ID_VENDA") as "NUM_COMPRAS",
-                    COALESCE(SUM("VALOR_TOTAL_VENDA"), 0) as "TOTAL_GASTO"
+                    CAST(COUNT("ID_VENDA") AS INTEGER) as "NUM_COMPRAS",
+                    CAST(COALESCE(SUM("VALOR_TOTAL_VENDA"), 0) AS DOUBLE PRECISION) as "TOTAL_GASTO"
                 FROM sales
                 GROUP BY "ID_CLIENTE", "CLIENTE"
                 ORDER BY "TOTAL_GASTO" DESC 
@@ -193,6 +270,30 @@ class SaleRepository(BaseRepository):
             
             return [dict(r) for r in cur.fetchall()]
 
+    def get_top_products(self, limit: int = 10) -> List[Dict]:
+        """
+        OTIMIZADO: Agregação em SQL com GROUP BY + ORDER BY + LIMIT.
+
+        QUANTIDADE_TOTAL (int) e RECEITA_TOTAL (float) já vêm tipados.
+        """
+        with self.get_conn() as conn:
+            cur = self._get_cursor(conn)
+            placeholder = '%s' if self.db_type == 'postgresql' else '?'
+            
+            cur.execute(f'''
+                SELECT 
+                    "CODIGO",
+                    "PRODUTO",
+                    CAST(COALESCE(SUM("QUANTIDADE"), 0) AS INTEGER) as "QUANTIDADE_TOTAL",
+                    CAST(COALESCE(SUM("PRECO_TOTAL"), 0) AS DOUBLE PRECISION) as "RECEITA_TOTAL"
+                FROM sales_items
+                GROUP BY "CODIGO", "PRODUTO"
+                ORDER BY "QUANTIDADE_TOTAL" DESC 
+                LIMIT {placeholder}
+            ''', (limit,))
+            
+            return [dict(r) for r in cur.fetchall()]
+
     def get_recent_sales(self, limit: int = 10) -> List[Dict]:
         """
         OTIMIZADO: ORDER BY + LIMIT direto no SQL.
@@ -223,6 +324,22 @@ class SaleRepository(BaseRepository):
         except Exception as e:
             raise Exception(f"Erro ao deletar venda: {str(e)}")
 
+    def delete_many(self, ids_venda: List[str]) -> int:
+        """OTIMIZADO: Deleta vários headers de venda em 1 query. Retorna linhas removidas."""
+        ids = list(dict.fromkeys(ids_venda))
+        if not ids:
+            return 0
+        try:
+            with self.get_conn() as conn:
+                cur = self._get_cursor(conn)
+                cur.execute(
+                    f'DELETE FROM sales WHERE "ID_VENDA" IN ({self._placeholder(len(ids))})',
+                    ids
+                )
+                return cur.rowcount
+        except Exception as e:
+            raise Exception(f"Erro ao deletar vendas: {str(e)}")
+
     def get_sale_with_items(self, id_venda: str) -> Dict:
         """
         OTIMIZADO: JOIN para pegar header + items em 1 query.
@@ -4,10 +4,14 @@ Client service for business logic.
 This module orchestrates client operations, validation, and business rules.
 """
 
+import sys
 from typing import Optional, List, Dict
+
+import pandas as pd
+
 from src.models.client import Client, TipoCliente, FaixaIdade
 from src.repositories.client_repository import ClientRepository
-from src.validators.client_validator import ClientValidator
+from src.validators.client_validator import ClientValidator, digits_only
 from src.utils.id_generator import IDGenerator
 
 
@@ -69,39 +73,9 @@ class ClientService:
             existing_ids = [c['ID_CLIENTE'] for c in self.repository.find_all()]
             id_cliente = IDGenerator.generate_client_id(existing_ids)
             
-            # Normalize tipo
-            tipo = str(tipo).lower().strip()
-            
-            # Validate and format CPF/CNPJ if provided
-            if cpf_cnpj and str(cpf_cnpj).strip():
-                is_valid, error_msg = self.validator.validate_cpf_cnpj(cpf_cnpj, tipo)
-                if not is_valid:
-                    raise ValueError(error_msg)
-                
-                # Format for storage
-                if tipo == 'pessoa':
-                    cpf_cnpj = self.validator.format_cpf(cpf_cnpj)
-                elif tipo == 'empresa':
-                    cpf_cnpj = self.validator.format_cnpj(cpf_cnpj)
-            
-            # Validate and format phone if provided
-            if telefone and telefone.strip():
-                if not self.validator.validate_phone(telefone):
-                    raise ValueError("Formato de telefone inválido. Use (00) 00000-0000 ou (00) 0000-0000")
-                telefone = self.validator.format_phone(telefone)
-            
-            # Create Client instance (validates automatically)
-            client = Client(
-                id_cliente=id_cliente,
-                cliente=cliente,
-                vendedor=vendedor,
-                tipo=tipo,
-                idade=idade,
-                genero=genero,
-                profissao=profissao,
-                cpf_cnpj=cpf_cnpj,
-                telefone=telefone,
-                endereco=endereco
+            client = self._build_client(
+                id_cliente, cliente, vendedor, tipo, idade, genero,
+                profissao, cpf_cnpj, telefone, endereco
             )
             
             # Save to repository
@@ -124,6 +98,174 @@ class ClientService:
         except Exception as e:
             raise Exception(f"Erro inesperado ao cadastrar cliente: {str(e)}")
     
+    def register_clients_bulk(self, clients: List[Dict]) -> List[Client]:
+        """
+        Register MANY clients at once (imports / data seeding).
+        
+        Every client is validated up front like in register_client();
+        then IDs come from one IDGenerator.generate_client_ids() call and
+        rows are written by one ClientRepository.save_many(), inside a
+        single transaction.
+        
+        Args:
+            clients: List of dicts with the register_client() keyword
+                     arguments ('cliente', 'vendedor', 'tipo', ...)
+            
+        Returns:
+            List of Client instances, in input order
+            
+        Raises:
+            ValueError: If any client fails validation (nothing is saved)
+        """
+        if not clients:
+            return []
+        
+        try:
+            existing_ids = [c['ID_CLIENTE'] for c in self.repository.find_all(columns=['ID_CLIENTE'])]
+            new_ids = IDGenerator.generate_client_ids(existing_ids, len(clients))
+            valid_docs = self._valid_documents(clients)
+            
+            built = [
+                self._build_client(
+                    id_cliente,
+                    c['cliente'],
+                    c['vendedor'],
+                    c['tipo'],
+                    c.get('idade', ""),
+                    c.get('genero', ""),
+                    c.get('profissao', ""),
+                    c.get('cpf_cnpj', ""),
+                    c.get('telefone', ""),
+                    c.get('endereco', ""),
+                    document_checked=doc_ok
+                )
+                for id_cliente, c, doc_ok in zip(new_ids, clients, valid_docs)
+            ]
+            
+            with self.repository.transaction():
+                self.repository.save_many(built)
+            
+            print(f"✓ {len(built)} cliente(s) cadastrado(s) em lote")
+            return built
+            
+        except ValueError as e:
+            raise ValueError(f"Erro ao cadastrar clientes em lote: {str(e)}")
+        except Exception as e:
+            raise Exception(f"Erro inesperado ao cadastrar clientes em lote: {str(e)}")
+    
+    def ensure_clients(self, clients: List[Dict]) -> List[Client]:
+        """
+        Register only the clients that are not stored yet.
+        
+        Idempotent setup helper (seeding / fixtures). A client counts as
+        existing when its CPF/CNPJ matches a stored one or, without a
+        document, when a stored client has the same name (case-insensitive).
+        One query reads the stored clients; the rest go through
+        register_clients_bulk().
+        
+        Args:
+            clients: List of dicts in the register_clients_bulk() shape
+            
+        Returns:
+            List of the Client instances actually created
+        """
+        stored = self.repository.find_all(columns=['CLIENTE', 'CPF_CNPJ'])
+        docs = {digits_only(str(c.get('CPF_CNPJ') or '')) for c in stored}
+        docs.discard('')
+        names = {str(c.get('CLIENTE') or '').strip().lower() for c in stored}
+        
+        missing = []
+        for c in clients:
+            doc = digits_only(str(c.get('cpf_cnpj') or ''))
+            if doc:
+                if doc in docs:
+                    continue
+                docs.add(doc)
+            else:
+                name = str(c['cliente']).strip().lower()
+                if name in names:
+                    continue
+                names.add(name)
+            missing.append(c)
+        
+        return self.register_clients_bulk(missing)
+    
+    def _build_client(
+        self,
+        id_cliente: str,
+        cliente: str,
+        vendedor: str,
+        tipo: str,
+        idade: str,
+        genero: str,
+        profissao: str,
+        cpf_cnpj: str,
+        telefone: str,
+        endereco: str,
+        document_checked: bool = False
+    ) -> Client:
+        """
+        Validate and normalize the input fields and build the Client.
+        
+        Args:
+            document_checked: CPF/CNPJ already validated for this tipo
+                (see _valid_documents); skips the per-value check
+        
+        Raises:
+            ValueError: If validation fails or business rules are violated
+        """
+        # Normalize tipo
+        tipo = str(tipo).lower().strip()
+        
+        # Validate and format CPF/CNPJ if provided
+        if cpf_cnpj and str(cpf_cnpj).strip():
+            if not document_checked:
+                is_valid, error_msg = self.validator.validate_cpf_cnpj(cpf_cnpj, tipo)
+                if not is_valid:
+                    raise ValueError(error_msg)
+            
+            # Format for storage
+            if tipo == 'pessoa':
+                cpf_cnpj = self.validator.format_cpf(cpf_cnpj)
+            elif tipo == 'empresa':
+                cpf_cnpj = self.validator.format_cnpj(cpf_cnpj)
+        
+        # Validate and format phone if provided
+        if telefone and telefone.strip():
+            if not self.validator.validate_phone(telefone):
+                raise ValueError("Formato de telefone inválido. Use (00) 00000-0000 ou (00) 0000-0000")
+            telefone = self.validator.format_phone(telefone)
+        
+        # Create Client instance (validates automatically)
+        return Client(
+            id_cliente=id_cliente,
+            cliente=cliente,
+            vendedor=vendedor,
+            tipo=tipo,
+            idade=idade,
+            genero=genero,
+            profissao=profissao,
+            cpf_cnpj=cpf_cnpj,
+            telefone=telefone,
+            endereco=endereco
+        )
+    
+    @staticmethod
+    def _valid_documents(clients: List[Dict]) -> List[bool]:
+        """
+        Check the CPF/CNPJ of a whole batch, one NumPy pass per document type.
+        
+        True where the document is valid for the client's tipo (CPF for
+        'pessoa', CNPJ for 'empresa'). Rows left False, including those
+        without a document, go through the per-value check in
+        _build_client, which raises with the specific message.
+        """
+        docs = pd.Series([str(c.get('cpf_cnpj') or '') for c in clients])
+        tipos = pd.Series([str(c.get('tipo', '')).lower().strip() for c in clients])
+        valid = (tipos == 'pessoa') & ClientValidator.validate_cpf_series(docs)
+        valid |= (tipos == 'empresa') & ClientValidator.validate_cnpj_series(docs)
+        return valid.tolist()
+    
     def update_client_info(
         self,
         id_cliente: str,
@@ -284,19 +426,22 @@ class ClientService:
         """
         stats = self.repository.get_statistics()
         
-        print("\n" + "="*60)
-        print("  ESTATÍSTICAS DE CLIENTES")
-        print("="*60)
-        print(f"Total de clientes: {stats['total']}")
-        print(f"  Pessoas físicas: {stats['pessoas']}")
-        print(f"  Empresas: {stats['empresas']}")
+        # Relatório montado inteiro e escrito de uma vez (1 write, não 1 por vendedor)
+        lines = [
+            "\n" + "="*60,
+            "  ESTATÍSTICAS DE CLIENTES",
+            "="*60,
+            f"Total de clientes: {stats['total']}",
+            f"  Pessoas físicas: {stats['pessoas']}",
+            f"  Empresas: {stats['empresas']}"
+        ]
         
         if stats['por_vendedor']:
-            print("\nClientes por vendedor:")
-            for vendedor, count in stats['por_vendedor'].items():
-                print(f"  - {vendedor}: {count} cliente(s)")
+            lines.append("\nClientes por vendedor:")
+            lines += [f"  - {vendedor}: {count} cliente(s)" for vendedor, count in stats['por_vendedor'].items()]
         
-        print("="*60)
+        lines.append("="*60)
+        sys.stdout.write("\n".join(lines) + "\n")
         
         return stats
     
@@ -12,6 +12,8 @@ import json
 import os
 from typing import Dict, List, Optional
 
+import numpy as np
+
 
 class ExpenseService:
     """Service para gerenciar custos e calcular margens corretas."""
@@ -218,6 +220,56 @@ class ExpenseService:
             'unit_contribution': contribution_margin / quantity if quantity > 0 else 0
         }
     
+    def calculate_product_margins(
+        self,
+        sale_prices: List[float],
+        cost_prices: List[float],
+        payment_method: str = 'pix'
+    ) -> Dict[str, np.ndarray]:
+        """
+        Margens unitárias (quantidade 1) de vários produtos de uma vez.
+        
+        Mesmas fórmulas de calculate_product_margin, mas com NumPy sobre
+        todos os produtos e a configuração de custos lida uma única vez.
+        Produtos com preço <= 0 ficam com margens e custos variáveis zerados.
+        
+        Args:
+            sale_prices: Preços unitários de venda
+            cost_prices: Custos unitários (COGS), na mesma ordem
+            payment_method: Meio de pagamento
+            
+        Returns:
+            Dicionário com arrays 'gross_margin_pct',
+            'contribution_margin_pct' e 'variable_costs_total'
+        """
+        revenue = np.asarray(sale_prices, dtype=float)
+        cogs = np.asarray(cost_prices, dtype=float)
+        priced = revenue > 0
+        safe_revenue = np.where(priced, revenue, 1.0)
+        
+        # Custos variáveis por unidade: taxa (% da receita) + valores fixos
+        variable_costs = self.get_variable_costs()
+        payment_fee_config = variable_costs.get('payment_fee', {})
+        payment_lower = payment_method.lower().replace(' ', '_')
+        applies_to = [m.lower().replace(' ', '_') for m in payment_fee_config.get('applies_to', [])]
+        fee_pct = float(payment_fee_config.get('value', 0)) if payment_lower in applies_to else 0.0
+        
+        var_total = revenue * (fee_pct / 100)
+        var_total = var_total + float(variable_costs.get('packaging', {}).get('value', 0))
+        var_total = var_total + float(variable_costs.get('shipping_materials', {}).get('value', 0))
+        card_config = variable_costs.get('card_materials', {})
+        if card_config:
+            var_total = var_total + float(card_config.get('value', 0))
+        
+        gross_profit = revenue - cogs
+        contribution_margin = gross_profit - var_total
+        
+        return {
+            'gross_margin_pct': np.where(priced, gross_profit / safe_revenue * 100, 0.0),
+            'contribution_margin_pct': np.where(priced, contribution_margin / safe_revenue * 100, 0.0),
+            'variable_costs_total': np.where(priced, var_total, 0.0)
+        }
+    
     # ========== MÉTODOS LEGADOS (compatibilidade) ==========
     
     def get_expense_per_sale(self, monthly_sales_count: int) -> float:
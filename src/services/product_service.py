@@ -4,7 +4,11 @@ Product service for business logic.
 This module orchestrates product operations, validation, and business rules.
 """
 
+import sys
 from typing import Optional, List, Dict
+
+import numpy as np
+
 from src.models.product import Product
 from src.repositories.product_repository import ProductRepository
 
@@ -84,6 +88,71 @@ class ProductService:
         except Exception as e:
             raise Exception(f"Erro inesperado ao cadastrar produto: {str(e)}")
     
+    def register_products_bulk(self, products: List[Dict]) -> List[Product]:
+        """
+        Register MANY products at once (imports / data seeding).
+        
+        Every product is validated up front like in register_product();
+        then all rows are written by one ProductRepository.save_many(),
+        inside a single transaction.
+        
+        Args:
+            products: List of dicts with the register_product() keyword
+                      arguments ('codigo', 'produto', 'categoria', 'custo',
+                      'valor', 'estoque')
+            
+        Returns:
+            List of Product instances, in input order
+            
+        Raises:
+            ValueError: If any product fails validation or its CODIGO
+                already exists (nothing is saved)
+        """
+        if not products:
+            return []
+        
+        try:
+            # Create Product instances (validates automatically)
+            built = [
+                Product(
+                    codigo=p['codigo'],
+                    produto=p['produto'],
+                    categoria=p['categoria'],
+                    custo=p['custo'],
+                    valor=p['valor'],
+                    estoque=p['estoque']
+                )
+                for p in products
+            ]
+            
+            with self.repository.transaction():
+                self.repository.save_many(built)
+            
+            print(f"✓ {len(built)} produto(s) cadastrado(s) em lote")
+            return built
+            
+        except ValueError as e:
+            raise ValueError(f"Erro ao cadastrar produtos em lote: {str(e)}")
+        except Exception as e:
+            raise Exception(f"Erro inesperado ao cadastrar produtos em lote: {str(e)}")
+    
+    def ensure_products(self, products: List[Dict]) -> List[Product]:
+        """
+        Register only the products whose CODIGO does not exist yet.
+        
+        Idempotent setup helper (seeding / fixtures): one query finds the
+        codes already stored, the rest go through register_products_bulk().
+        
+        Args:
+            products: List of dicts in the register_products_bulk() shape
+            
+        Returns:
+            List of the Product instances actually created
+        """
+        existing = self.repository.get_by_codigos([p['codigo'] for p in products])
+        missing = [p for p in products if str(p['codigo']).strip().upper() not in existing]
+        return self.register_products_bulk(missing)
+    
     def update_product_info(
         self,
         codigo: str,
@@ -236,9 +305,10 @@ class ProductService:
         products = self.repository.get_low_stock(threshold)
         
         if products:
-            print(f"\n⚠️  {len(products)} produto(s) com estoque baixo:")
-            for p in products:
-                print(f"  - {p['PRODUTO']} ({p['CODIGO']}): {p['ESTOQUE']} unidades")
+            # Relatório montado inteiro e escrito de uma vez (1 write, não 1 por produto)
+            lines = [f"\n⚠️  {len(products)} produto(s) com estoque baixo:"]
+            lines += [f"  - {p['PRODUTO']} ({p['CODIGO']}): {p['ESTOQUE']} unidades" for p in products]
+            sys.stdout.write("\n".join(lines) + "\n")
         else:
             print(f"✓ Nenhum produto com estoque abaixo de {threshold} unidades")
         
@@ -286,6 +356,29 @@ class ProductService:
             return float(product['VALOR'])
         return None
     
+    def snapshot(self) -> Dict[str, np.ndarray]:
+        """
+        All products as columns (one NumPy array per field).
+        
+        Loaded with a single typed query; use for arithmetic over the
+        whole catalog (margins, stock totals) instead of per-row dicts.
+        Rows are in storage order, aligned across all arrays.
+        
+        Returns:
+            Dict with 'CODIGO', 'PRODUTO', 'CATEGORIA' (str arrays),
+            'CUSTO', 'VALOR' (float64) and 'ESTOQUE' (int64)
+        """
+        rows = self.repository.find_all_typed()
+        n = len(rows)
+        return {
+            'CODIGO': np.array([r['CODIGO'] for r in rows], dtype=str),
+            'PRODUTO': np.array([r['PRODUTO'] for r in rows], dtype=str),
+            'CATEGORIA': np.array([r['CATEGORIA'] for r in rows], dtype=str),
+            'CUSTO': np.fromiter((r['CUSTO'] for r in rows), dtype=np.float64, count=n),
+            'VALOR': np.fromiter((r['VALOR'] for r in rows), dtype=np.float64, count=n),
+            'ESTOQUE': np.fromiter((r['ESTOQUE'] for r in rows), dtype=np.int64, count=n)
+        }
+    
     def get_inventory_summary(self) -> Dict:
         """
         Get comprehensive inventory summary.
@@ -293,11 +386,11 @@ class ProductService:
         Returns:
             Dictionary with inventory statistics
         """
-        all_products = self.repository.find_all()
+        stock = self.snapshot()['ESTOQUE']
         values = self.repository.get_inventory_value()
         
-        total_products = len(all_products)
-        total_items = sum(int(p.get('ESTOQUE', 0)) for p in all_products)
+        total_products = len(stock)
+        total_items = stock.sum()
         
         summary = {
             'total_products': total_products,
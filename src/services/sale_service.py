@@ -2,23 +2,28 @@
 Sale service for business logic - WITH MULTI-ITEM SUPPORT.
 """
 
+import logging
 from typing import Optional, List, Dict
 from datetime import datetime
 from collections import namedtuple
-from src.models.sale import Sale, MeioPagamento
+from src.models.sale import Sale, PAYMENT_METHODS, is_valid_sale_date
+from src.models.sale_item import SaleItem
 from src.repositories.sale_repository import SaleRepository
+from src.repositories.sale_item_repository import SaleItemRepository
 from src.repositories.product_repository import ProductRepository
 from src.repositories.client_repository import ClientRepository
 from src.utils.id_generator import IDGenerator
 
 
+logger = logging.getLogger(__name__)
+
+
 SaleRecord = namedtuple('SaleRecord', [
     'ID_VENDA', 'DATA', 'CLIENTE', 'ID_CLIENTE', 'PRODUTO', 
     'CODIGO', 'CATEGORIA', 'QUANTIDADE', 'PRECO_UNIT', 
     'PRECO_TOTAL', 'MEIO', 'VALOR_TOTAL_VENDA'  # ← Adicionado
 ])
 
-
 class SaleService:
     """
     Service layer for sale business logic with multi-item support.
@@ -28,11 +33,13 @@ class SaleService:
         self,
         sale_repository: Optional[SaleRepository] = None,
         product_repository: Optional[ProductRepository] = None,
-        client_repository: Optional[ClientRepository] = None
+        client_repository: Optional[ClientRepository] = None,
+        item_repository: Optional[SaleItemRepository] = None
     ):
         self.sale_repository = sale_repository or SaleRepository()
         self.product_repository = product_repository or ProductRepository()
         self.client_repository = client_repository or ClientRepository()
+        self.item_repository = item_repository or SaleItemRepository()
     
     """
 Substitua o método register_sale_multi_item no seu sale_service.py por este:
@@ -51,7 +58,8 @@ Substitua o método register_sale_multi_item no seu sale_service.py por este:
         Args:
             id_cliente: Client ID
             meio: Payment method
-            items: List of dicts with 'codigo', 'quantidade', 'preco_unit' (optional)
+            items: List of dicts with 'codigo', 'quantidade', 'preco_unit' (optional).
+                Repeated codes are merged into a single line (quantities summed).
             data: Sale date DD/MM/YYYY (uses today if None)
             
         Returns:
@@ -60,46 +68,46 @@ Substitua o método register_sale_multi_item no seu sale_service.py por este:
         Raises:
             ValueError: If validation fails
         """
-        from src.models.sale_item import SaleItem
-        from src.repositories.sale_item_repository import SaleItemRepository
-        from src.utils.id_generator import IDGenerator
-        
         try:
+            # Tipos resolvidos uma vez na entrada; os loops abaixo não convertem
+            items = self._coerce_items(items)
+            
             # === STEP 1: Validate Client ===
             client = self.client_repository.get_by_id(id_cliente)
             if not client:
                 raise ValueError(f"Cliente '{id_cliente}' não encontrado")
             
             # === STEP 2: Generate single ID_VENDA for all items ===
-            existing_ids = [s['ID_VENDA'] for s in self.sale_repository.find_all()]
-            id_venda = IDGenerator.generate_sale_id(existing_ids)
+            id_venda = self.sale_repository.next_sale_id()
             
             # Use provided date or today's date
-            if data is None:
-                data = datetime.now().strftime('%d/%m/%Y')
-            else:
-                # Validate date format (DD/MM/YYYY)
-                try:
-                    datetime.strptime(data, '%d/%m/%Y')
-                except ValueError:
-                    raise ValueError("Formato de data inválido. Use DD/MM/YYYY")
+            data = self._resolve_sale_date(data)
             
-            # === STEP 3: Validate all items and check stock ===
-            validated_items = []
+            # === STEP 3: Validate all items, check stock and build SaleItems ===
+            sale_items = []
+            stock_deltas = {}
             total_venda = 0.0
+            total_items = 0
+            
+            # Mesmo código repetido no carrinho vira uma linha só:
+            # o estoque é validado contra a quantidade somada.
+            merged_items = self._merge_items(items)
+            
+            # Todos os produtos do carrinho em 1 query (evita N+1)
+            products = self.product_repository.get_by_codigos(list(merged_items))
             
-            for item in items:
-                codigo = item['codigo']
-                quantidade = int(item['quantidade'])
-                preco_unit = item.get('preco_unit')
+            for codigo, item in merged_items.items():
+                quantidade = item['quantidade']
+                preco_unit = item['preco_unit']
                 
-                # Validate product
-                product = self.product_repository.get_by_codigo(codigo)
-                if not product:
-                    raise ValueError(f"Produto '{codigo}' não encontrado")
+                # Validate product (caminho feliz: lookup direto, sem .get + if)
+                try:
+                    product = products[codigo]
+                except KeyError:
+                    raise ValueError(f"Produto '{codigo}' não encontrado") from None
                 
                 # Check stock
-                current_stock = int(product['ESTOQUE'])
+                current_stock = product['ESTOQUE']
                 if current_stock < quantidade:
                     raise ValueError(
                         f"Estoque insuficiente para '{product['PRODUTO']}'. "
@@ -108,26 +116,24 @@ Substitua o método register_sale_multi_item no seu sale_service.py por este:
                 
                 # Use current product price if not specified
                 if preco_unit is None:
-                    preco_unit = float(product['VALOR'])
-                else:
-                    preco_unit = float(preco_unit)
+                    preco_unit = product['VALOR']
                 
                 preco_total = preco_unit * quantidade
                 total_venda += preco_total
+                total_items += quantidade
                 
-                validated_items.append({
-                    'codigo': codigo,
-                    'produto': product['PRODUTO'],
-                    'categoria': product['CATEGORIA'],
-                    'quantidade': quantidade,
-                    'preco_unit': preco_unit,
-                    'preco_total': preco_total,
-                    'current_stock': current_stock
-                })
+                sale_items.append(SaleItem(
+                    id_venda=id_venda,
+                    produto=product['PRODUTO'],
+                    categoria=product['CATEGORIA'],
+                    codigo=codigo,
+                    quantidade=quantidade,
+                    preco_unit=preco_unit,
+                    preco_total=preco_total
+                ))
+                stock_deltas[codigo] = -quantidade
             
             # === STEP 4: Create Sale header ===
-            from src.models.sale import Sale
-            
             sale = Sale(
                 id_venda=id_venda,
                 id_cliente=client['ID_CLIENTE'],
@@ -137,53 +143,19 @@ Substitua o método register_sale_multi_item no seu sale_service.py por este:
                 valor_total_venda=total_venda
             )
             
-            # === STEP 5: Create SaleItem instances ===
-            sale_items = []
-            for item in validated_items:
-                sale_item = SaleItem(
-                    id_venda=id_venda,
-                    produto=item['produto'],
-                    categoria=item['categoria'],
-                    codigo=item['codigo'],
-                    quantidade=item['quantidade'],
-                    preco_unit=item['preco_unit'],
-                    preco_total=item['preco_total']
-                )
-                sale_items.append(sale_item)
-            
-            # === STEP 6: Save sale header ===
-            self.sale_repository.save(sale)
-            
-            # === STEP 7: Save all sale items ===
-            item_repo = SaleItemRepository()
-            try:
-                item_repo.save_many(sale_items)
-            except Exception as e:
-                # Rollback: delete sale header
-                self.sale_repository.delete(id_venda)
-                raise Exception(f"Erro ao salvar itens (venda revertida): {str(e)}")
-            
-            # === STEP 8: Update inventory for all items ===
-            try:
-                for item in validated_items:
-                    self.product_repository.update_stock(item['codigo'], -item['quantidade'])
-            except Exception as e:
-                # Rollback: delete sale header and items
-                item_repo.delete_by_sale_id(id_venda)
-                self.sale_repository.delete(id_venda)
-                raise Exception(f"Erro ao atualizar estoque (venda revertida): {str(e)}")
+
+            # === STEP 5: Save header, items and inventory atomically ===
+            # Uma única transação: se qualquer passo falhar, nada é gravado.
+            with self.sale_repository.transaction():
+                self.sale_repository.save(sale)
+                self.item_repository.save_many(sale_items)
+                self.product_repository.update_stock_many(stock_deltas)
             
             # === SUCCESS ===
-            total_items = sum(item['quantidade'] for item in validated_items)
-            
-            print("✅ Venda registrada com sucesso!")
-            print(f"  ID: {id_venda}")
-            print(f"  Data: {data}")
-            print(f"  Cliente: {client['CLIENTE']}")
-            print(f"  Produtos: {len(sale_items)} diferentes")
-            print(f"  Total de itens: {total_items} unidade(s)")
-            print(f"  Valor total: R$ {total_venda:.2f}")
-            print(f"  Pagamento: {meio}")
+            logger.info(
+                "Venda %s registrada: data=%s cliente=%s produtos=%d itens=%d total=R$ %.2f pagamento=%s",
+                id_venda, data, client['CLIENTE'], len(sale_items), total_items, total_venda, meio
+            )
             
             return {
                 'id_venda': id_venda,
@@ -197,6 +169,187 @@ Substitua o método register_sale_multi_item no seu sale_service.py por este:
         except Exception as e:
             raise Exception(f"Erro inesperado ao registrar venda: {str(e)}")
     
+    def register_sales_bulk(self, sales: List[Dict]) -> List[Dict]:
+        """
+        Register MANY multi-item sales at once (imports / data seeding).
+        
+        All sales are validated up front (clients, products and the
+        combined stock demand) and then persisted in a single transaction:
+        IDs come from one IDGenerator.generate_sale_ids() call, products
+        from one get_by_codigos() query, items from one save_many() and
+        inventory from one update_stock_many().
+        
+        Args:
+            sales: List of dicts with 'id_cliente', 'meio', 'items' and
+                   optional 'data' (same shape as register_sale_multi_item).
+                   Single-item sales may instead give 'codigo',
+                   'quantidade' and optional 'preco_unit' directly, like
+                   register_sale
+            
+        Returns:
+            List of dicts with sale info, in input order
+            
+        Raises:
+            ValueError: If any sale fails validation (nothing is saved)
+        """
+        if not sales:
+            return []
+        
+        try:
+            # === Clients (one lookup per distinct client) ===
+            clients = {}
+            for s in sales:
+                id_cliente = s['id_cliente']
+                if id_cliente not in clients:
+                    client = self.client_repository.get_by_id(id_cliente)
+                    if not client:
+                        raise ValueError(f"Cliente '{id_cliente}' não encontrado")
+                    clients[id_cliente] = client
+            
+            # === IDs for every sale in one pass ===
+            last_id = self.sale_repository.get_max_sale_id()
+            new_ids = IDGenerator.generate_sale_ids([last_id] if last_id else [], len(sales))
+            
+            # === Products (one query) + combined stock demand ===
+            merged_per_sale = [self._merge_items(self._coerce_items(self._sale_items(s))) for s in sales]
+            demand: Dict[str, int] = {}
+            for merged in merged_per_sale:
+                for codigo, item in merged.items():
+                    demand[codigo] = demand.get(codigo, 0) + item['quantidade']
+            
+            products = self.product_repository.get_by_codigos(list(demand))
+            for codigo, quantidade in demand.items():
+                try:
+                    product = products[codigo]
+                except KeyError:
+                    raise ValueError(f"Produto '{codigo}' não encontrado") from None
+                current_stock = product['ESTOQUE']
+                if current_stock < quantidade:
+                    raise ValueError(
+                        f"Estoque insuficiente para '{product['PRODUTO']}'. "
+                        f"Disponível: {current_stock}. Solicitado: {quantidade}."
+                    )
+            
+            # === Build headers and items ===
+            headers = []
+            sale_items = []
+            results = []
+            for s, id_venda, merged in zip(sales, new_ids, merged_per_sale):
+                client = clients[s['id_cliente']]
+                total_venda = 0.0
+                total_quantity = 0
+                for codigo, item in merged.items():
+                    product = products[codigo]
+                    preco_unit = item['preco_unit']
+                    if preco_unit is None:
+                        preco_unit = product['VALOR']
+                    sale_item = SaleItem(
+                        id_venda=id_venda,
+                        produto=product['PRODUTO'],
+                        categoria=product['CATEGORIA'],
+                        codigo=codigo,
+                        quantidade=item['quantidade'],
+                        preco_unit=preco_unit
+                    )
+                    sale_items.append(sale_item)
+                    total_venda += sale_item.preco_total
+                    total_quantity += sale_item.quantidade
+                
+                headers.append(Sale(
+                    id_venda=id_venda,
+                    id_cliente=client['ID_CLIENTE'],
+                    cliente=client['CLIENTE'],
+                    meio=s['meio'],
+                    data=self._resolve_sale_date(s.get('data')),
+                    valor_total_venda=total_venda
+                ))
+                results.append({
+                    'id_venda': id_venda,
+                    'total_items': len(merged),
+                    'total_quantity': total_quantity,
+                    'total_value': total_venda
+                })
+            
+            # === Persist everything atomically ===
+            with self.sale_repository.transaction():
+                for sale in headers:
+                    self.sale_repository.save(sale)
+                self.item_repository.save_many(sale_items)
+                self.product_repository.update_stock_many(
+                    {codigo: -quantidade for codigo, quantidade in demand.items()}
+                )
+            
+            logger.info("%d venda(s) registrada(s) em lote", len(results))
+            return results
+            
+        except ValueError as e:
+            raise ValueError(f"Erro ao registrar vendas em lote: {str(e)}")
+        except Exception as e:
+            raise Exception(f"Erro inesperado ao registrar vendas em lote: {str(e)}")
+    
+    @staticmethod
+    def _resolve_sale_date(data: Optional[str]) -> str:
+        """
+        Return the sale date as DD/MM/YYYY (today if None).
+        
+        Raises:
+            ValueError: If the given date is not in DD/MM/YYYY format
+        """
+        if data is None:
+            return datetime.now().strftime('%d/%m/%Y')
+        if not is_valid_sale_date(data):
+            raise ValueError("Formato de data inválido. Use DD/MM/YYYY")
+        return data
+    
+    @staticmethod
+    def _sale_items(sale: Dict) -> List[Dict]:
+        """Cart items of a bulk sale entry (multi-item or register_sale shape)."""
+        if 'items' in sale:
+            return sale['items']
+        return [{
+            'codigo': sale['codigo'],
+            'quantidade': sale['quantidade'],
+            'preco_unit': sale.get('preco_unit')
+        }]
+    
+    @staticmethod
+    def _coerce_items(items: List[Dict]) -> List[Dict]:
+        """
+        Normalize raw cart items (form/JSON input) once at the boundary.
+        
+        Returns:
+            List of {'codigo': str (upper), 'quantidade': int,
+            'preco_unit': float | None}
+        """
+        return [
+            {
+                'codigo': str(item['codigo']).strip().upper(),
+                'quantidade': int(item['quantidade']),
+                'preco_unit': None if item.get('preco_unit') is None else float(item['preco_unit'])
+            }
+            for item in items
+        ]
+    
+    @staticmethod
+    def _merge_items(items: List[Dict]) -> Dict[str, Dict]:
+        """
+        Coalesce cart items that share the same product code.
+        
+        Expects items already normalized by _coerce_items().
+        Quantities are summed; the last explicit 'preco_unit' wins.
+        Order of first appearance is preserved.
+        
+        Returns:
+            Dict codigo -> {'quantidade': int, 'preco_unit': float | None}
+        """
+        merged: Dict[str, Dict] = {}
+        for item in items:
+            entry = merged.setdefault(item['codigo'], {'quantidade': 0, 'preco_unit': None})
+            entry['quantidade'] += item['quantidade']
+            if item['preco_unit'] is not None:
+                entry['preco_unit'] = item['preco_unit']
+        return merged
+    
     """
 Substitua o método register_sale (legacy - single item) no seu sale_service.py:
 """
@@ -226,14 +379,8 @@ Substitua o método register_sale (legacy - single item) no seu sale_service.py:
         Returns:
             Dict with sale info
         """
-        # Get product to determine price if not specified
-        product = self.product_repository.get_by_codigo(codigo)
-        if not product:
-            raise ValueError(f"Produto '{codigo}' não encontrado")
-        
-        if preco_unit is None:
-            preco_unit = float(product['VALOR'])
-        
+        # Produto e preço (quando None) são resolvidos pelo multi-item,
+        # que já busca o produto; sem lookup duplicado aqui.
         # Create single item list
         items = [{
             'codigo': codigo,
@@ -266,59 +413,35 @@ Substitua o método register_sale (legacy - single item) no seu sale_service.py:
         
         Returns a FLAT list where each line represents one ITEM sold.
         """
-        from src.repositories.sale_item_repository import SaleItemRepository
-        
-        # OTIMIZADO: Usa find_all() em vez de get_all()/_read_csv()
-        sales = self.sale_repository.find_all()
+        # OTIMIZADO: JOIN item + venda feito no banco; linhas já tipadas,
+        # na ordem de SaleRecord._fields e sem itens órfãos
+        rows = self.item_repository.find_all_with_sale_rows()
         
-        item_repo = SaleItemRepository()
-        items = item_repo.find_all()
-        
-        if not items:
+        if not rows:
             return []
         
-        # Cria map de vendas por ID para lookup rápido
-        sales_map = {sale['ID_VENDA']: sale for sale in sales}
-        
-        # Convert to list
-        converted_sales = []
-        
-        for item in items:
-            # Find corresponding sale header
-            sale = sales_map.get(item['ID_VENDA'])
-            
-            if not sale:
-                continue  # Skip orphan items
-            
-            # Create SaleRecord with data from BOTH sources
-            try:
-                preco_total = float(item['PRECO_TOTAL'])
-                quantidade = int(item['QUANTIDADE'])
-                preco_unit = float(item['PRECO_UNIT'])
-                valor_total_venda = float(sale['VALOR_TOTAL_VENDA'])
-                
-                produto_norm = str(item.get('PRODUTO', '')).strip().title()
-                categoria_norm = str(item.get('CATEGORIA', '')).strip().title()
-                
-                sale_record = SaleRecord(
-                    ID_VENDA=sale['ID_VENDA'],
-                    DATA=sale['DATA'],
-                    CLIENTE=sale['CLIENTE'],
-                    ID_CLIENTE=sale['ID_CLIENTE'],
-                    PRODUTO=produto_norm,
-                    CODIGO=item['CODIGO'],
-                    CATEGORIA=categoria_norm,
-                    QUANTIDADE=quantidade,
-                    PRECO_UNIT=preco_unit,
-                    PRECO_TOTAL=preco_total,
-                    MEIO=sale['MEIO'],
-                    VALOR_TOTAL_VENDA=valor_total_venda
-                )
-                converted_sales.append(sale_record)
-                
-            except (ValueError, KeyError, TypeError) as e:
-                print(f"Error processing sale item: {e}")
-                continue
+        # Só PRODUTO/CATEGORIA ainda precisam de normalização em Python.
+        # Os nomes se repetem muito entre itens: normaliza cada valor uma vez.
+        title_cache = {}
+        
+        def norm(value):
+            result = title_cache.get(value)
+            if result is None:
+                result = title_cache[value] = str(value or '').strip().title()
+            return result
+        
+        converted_sales = [
+            SaleRecord._make((
+                id_venda, data, cliente, id_cliente,
+                norm(produto),
+                codigo,
+                norm(categoria),
+                quantidade, preco_unit, preco_total,
+                meio, valor_total_venda
+            ))
+            for (id_venda, data, cliente, id_cliente, produto, codigo, categoria,
+                 quantidade, preco_unit, preco_total, meio, valor_total_venda) in rows
+        ]
         
         # Sort by date descending (most recent first)
         def parse_date(date_str):
@@ -339,7 +462,9 @@ Substitua o método register_sale (legacy - single item) no seu sale_service.py:
                 
             return datetime.min
 
-        return sorted(converted_sales, key=lambda s: parse_date(s.DATA), reverse=True)
+        # Ordena a própria lista (sem alocar uma segunda cópia de K linhas)
+        converted_sales.sort(key=lambda s: parse_date(s.DATA), reverse=True)
+        return converted_sales
     
     def list_sales_by_client(self, id_cliente: str) -> List[dict]:
         return self.sale_repository.get_by_client(id_cliente)
@@ -357,69 +482,83 @@ Substitua o método register_sale (legacy - single item) no seu sale_service.py:
         """
         Get sales summary - FIXED for new structure.
         Uses sales.csv as SINGLE SOURCE OF TRUTH for revenue.
-        """
-        import pandas as pd
         
-        # Get summary from repository (already correct)
+        The repository already returns the correct data:
+        - total_sales: unique sales count from sales.csv
+        - total_revenue: sum of VALOR_TOTAL_VENDA from sales.csv ← CORRECT
+        - total_items_sold: sum of quantities from sales_items.csv
+        - average_sale_value: average from sales.csv
+        - by_payment_method: grouped by payment from sales.csv
+        - by_category: grouped from sales_items.csv
+        """
         summary = self.sale_repository.get_sales_summary()
-        
-        # The repository already returns the correct data:
-        # - total_sales: unique sales count from sales.csv
-        # - total_revenue: sum of VALOR_TOTAL_VENDA from sales.csv ← CORRECT
-        # - total_items_sold: sum of quantities from sales_items.csv
-        # - average_sale_value: average from sales.csv
-        # - by_payment_method: grouped by payment from sales.csv
-        # - by_category: grouped from sales_items.csv
-        
-        # Print summary (clean version)
-        print("\n" + "="*60)
-        print("  RESUMO DE VENDAS")
-        print("="*60)
-        print(f"Total de vendas: {summary['total_sales']}")
-        print(f"Receita total: R$ {summary['total_revenue']:.2f}")
-        print(f"Itens vendidos: {summary['total_items_sold']}")
-        print(f"Ticket médio: R$ {summary['average_sale_value']:.2f}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("%s", self.format_summary(summary))
+        return summary
+    
+    @staticmethod
+    def format_summary(summary: dict) -> str:
+        """Format get_sales_summary() output for terminal output."""
+        lines = [
+            "\n" + "="*60,
+            "  RESUMO DE VENDAS",
+            "="*60,
+            f"Total de vendas: {summary['total_sales']}",
+            f"Receita total: R$ {summary['total_revenue']:.2f}",
+            f"Itens vendidos: {summary['total_items_sold']}",
+            f"Ticket médio: R$ {summary['average_sale_value']:.2f}",
+        ]
         
         if summary['by_payment_method']:
-            print("\nPor meio de pagamento:")
+            lines.append("\nPor meio de pagamento:")
             for meio, valor in summary['by_payment_method'].items():
-                print(f"  - {meio}: R$ {valor:.2f}")
+                lines.append(f"  - {meio}: R$ {valor:.2f}")
         
         if summary['by_category']:
-            print("\nPor categoria:")
+            lines.append("\nPor categoria:")
             for cat, valor in sorted(summary['by_category'].items(), key=lambda x: x[1], reverse=True):
-                print(f"  - {cat}: R$ {valor:.2f}")
-        
-        print("="*60 + "\n")
+                lines.append(f"  - {cat}: R$ {valor:.2f}")
         
-        return summary
+        lines.append("="*60 + "\n")
+        return "\n".join(lines)
     
     def get_top_products(self, limit: int = 10) -> List[dict]:
-        products = self.sale_repository.get_top_products(limit)
-        
-        if products:
-            print(f"\n🏆 Top {len(products)} Produtos Mais Vendidos:")
-            for i, p in enumerate(products, 1):
-                print(f"{i}. {p['PRODUTO']} ({p['CODIGO']})")
-                print(f"   Quantidade: {int(p['QUANTIDADE_TOTAL'])} unidades")
-                print(f"   Receita: R$ {float(p['RECEITA_TOTAL']):.2f}")
-        
-        return products
+        """Top products by quantity sold (data only, no output)."""
+        return self.sale_repository.get_top_products(limit)
     
     def get_top_clients(self, limit: int = 10) -> List[dict]:
-        clients = self.sale_repository.get_top_clients(limit)
-        
-        if clients:
-            print(f"\n🏆 Top {len(clients)} Melhores Clientes:")
-            for i, c in enumerate(clients, 1):
-                print(f"{i}. {c['CLIENTE']} ({c['ID_CLIENTE']})")
-                print(f"   Compras: {int(c['NUM_COMPRAS'])}")
-                print(f"   Total gasto: R$ {float(c['TOTAL_GASTO']):.2f}")
-        
-        return clients
+        """Top clients by total spent (data only, no output)."""
+        return self.sale_repository.get_top_clients(limit)
+    
+    @staticmethod
+    def format_top_products(products: List[dict]) -> str:
+        """Format get_top_products() rows for terminal output."""
+        if not products:
+            return ""
+        
+        lines = [f"\n🏆 Top {len(products)} Produtos Mais Vendidos:"]
+        for i, p in enumerate(products, 1):
+            lines.append(f"{i}. {p['PRODUTO']} ({p['CODIGO']})")
+            lines.append(f"   Quantidade: {p['QUANTIDADE_TOTAL']} unidades")
+            lines.append(f"   Receita: R$ {p['RECEITA_TOTAL']:.2f}")
+        return "\n".join(lines)
+    
+    @staticmethod
+    def format_top_clients(clients: List[dict]) -> str:
+        """Format get_top_clients() rows for terminal output."""
+        if not clients:
+            return ""
+        
+        lines = [f"\n🏆 Top {len(clients)} Melhores Clientes:"]
+        for i, c in enumerate(clients, 1):
+            lines.append(f"{i}. {c['CLIENTE']} ({c['ID_CLIENTE']})")
+            lines.append(f"   Compras: {c['NUM_COMPRAS']}")
+            lines.append(f"   Total gasto: R$ {c['TOTAL_GASTO']:.2f}")
+        return "\n".join(lines)
     
     def get_available_payment_methods(self) -> List[str]:
-        return [e.value for e in MeioPagamento]
+        # Cópia da tupla pré-calculada: o chamador pode alterar a lista
+        return list(PAYMENT_METHODS)
     
     def calculate_sale_total(self, codigo: str, quantidade: int) -> dict:
         product = self.product_repository.get_by_codigo(codigo)
@@ -450,41 +589,98 @@ Substitua o método cancel_sale no seu sale_service.py por este:
         
         Args:
             id_venda: Sale ID to cancel
-            restore_stock: Whether to restore inventory
+            restore_stock: Whether to restore inventory (when False no
+                product is looked up; items are only deleted)
             
         Returns:
             True if successful
         """
-        from src.repositories.sale_item_repository import SaleItemRepository
-        
         # Get ALL items from this sale
-        item_repo = SaleItemRepository()
-        items = item_repo.get_by_sale_id(id_venda)
+        items = self.item_repository.get_by_sale_id(id_venda)
         
         if not items:
             raise ValueError(f"Venda '{id_venda}' não encontrada")
         
         try:
-            if restore_stock:
-                for item in items:
-                    codigo = item['CODIGO']
-                    quantidade = int(item['QUANTIDADE'])
-                    
-                    product = self.product_repository.get_by_codigo(codigo)
-                    if product:
-                        self.product_repository.update_stock(codigo, quantidade)
-                        print(f"✅ Estoque restaurado: +{quantidade} unidade(s) de {item['PRODUTO']}")
-                    else:
-                        print(f"⚠️ Produto {codigo} não existe mais. Estoque NÃO foi restaurado.")
-            
-            # Delete ALL items with this ID_VENDA
-            item_repo.delete_by_sale_id(id_venda)
-            
-            # Delete sale header
-            self.sale_repository.delete(id_venda)
-            
-            print(f"✅ Venda {id_venda} cancelada com sucesso ({len(items)} item(s))")
+            # Estoque + itens + header em uma única transação
+            with self.sale_repository.transaction():
+                if restore_stock:
+                    self._restore_stock(items)
+                
+                # Delete ALL items with this ID_VENDA
+                self.item_repository.delete_by_sale_id(id_venda)
+                
+                # Delete sale header
+                self.sale_repository.delete(id_venda)
+            
+            logger.info("Venda %s cancelada (%d item(s))", id_venda, len(items))
             return True
             
         except Exception as e:
-            raise Exception(f"Erro ao cancelar venda: {str(e)}")
\ No newline at end of file
+            raise Exception(f"Erro ao cancelar venda: {str(e)}")
+    
+    def cancel_sales_bulk(self, ids_venda: List[str], restore_stock: bool = True) -> int:
+        """
+        Cancel MANY sales at once.
+        
+        Items come from one query, stock is restored with one
+        update_stock_many() and items/headers are removed with one
+        DELETE each, all inside a single transaction.
+        
+        Args:
+            ids_venda: Sale IDs to cancel
+            restore_stock: Whether to restore inventory
+            
+        Returns:
+            Number of sales cancelled
+            
+        Raises:
+            ValueError: If any sale does not exist (nothing is cancelled)
+        """
+        ids = list(dict.fromkeys(ids_venda))
+        if not ids:
+            return 0
+        
+        items = self.item_repository.get_by_sale_ids(ids)
+        
+        found = {item['ID_VENDA'] for item in items}
+        missing = [id_venda for id_venda in ids if id_venda not in found]
+        if missing:
+            raise ValueError(f"Venda(s) não encontrada(s): {', '.join(missing)}")
+        
+        try:
+            with self.sale_repository.transaction():
+                if restore_stock:
+                    self._restore_stock(items)
+                self.item_repository.delete_by_sale_ids(ids)
+                self.sale_repository.delete_many(ids)
+            
+            logger.info("%d venda(s) cancelada(s) em lote (%d item(s))", len(ids), len(items))
+            return len(ids)
+            
+        except Exception as e:
+            raise Exception(f"Erro ao cancelar vendas em lote: {str(e)}")
+    
+    def _restore_stock(self, items: List[Dict]) -> None:
+        """
+        Return sold quantities to inventory with one update_stock_many().
+        
+        Items whose product no longer exists are skipped (logged).
+        """
+        # Produtos das vendas em 1 query (evita N+1)
+        products = self.product_repository.get_by_codigos([item['CODIGO'] for item in items])
+        
+        stock_deltas = {}
+        for item in items:
+            codigo = item['CODIGO']
+            quantidade = item['QUANTIDADE']
+            
+            key = str(codigo).strip().upper()
+            if key in products:
+                stock_deltas[key] = stock_deltas.get(key, 0) + quantidade
+                logger.info("Estoque restaurado: +%d unidade(s) de %s", quantidade, item['PRODUTO'])
+            else:
+                logger.warning("Produto %s não existe mais. Estoque NÃO foi restaurado.", codigo)
+        
+        # Todos os ajustes de estoque em 1 chamada
+        self.product_repository.update_stock_many(stock_deltas)
\ No newline at end of file
@@ -5,41 +5,298 @@ This module provides functions to create visual charts using matplotlib
 for sales trends, product performance, and other analytics.
 """
 
+import matplotlib
+matplotlib.use('Agg')  # Sem janela: gráficos só vão para arquivo
 import matplotlib.pyplot as plt
+import matplotlib.colors as mcolors
 import matplotlib.dates as mdates
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+import numpy as np
+import pandas as pd
 from datetime import datetime
-from typing import List, Dict, Optional
+from functools import lru_cache
+from xml.sax.saxutils import escape
+from typing import List, Dict, Optional, Tuple, Union, BinaryIO
+import math
 import os
 
 
+# Objetos puros, criados uma vez e compartilhados por todos os gráficos
+_BRL_FMT = plt.FuncFormatter(lambda x, p: f'R$ {x:,.0f}')
+_DATE_FMT = mdates.DateFormatter('%d/%m')
+_TIMESTAMP_FMT = '%Y%m%d_%H%M%S'
+
+# Destino de um gráfico: True (arquivo em output_dir) ou um buffer binário
+# (ex.: BytesIO para resposta web/e-mail, sem disco). Não há saída em tela:
+# o backend é Agg e as figuras ficam fora do pyplot
+ChartTarget = Union[bool, BinaryIO]
+# Um formato ('png') ou vários (('png', 'pdf')) salvos a partir da mesma figura
+ChartFormats = Union[str, Tuple[str, ...]]
+# O que um plot_* devolve: caminho (um formato), lista de caminhos (tupla
+# de formatos), o próprio buffer recebido, ou None quando não há dados
+ChartResult = Union[str, List[str], BinaryIO, None]
+
+# Acima disso a tendência diária é agregada em médias semanais
+TREND_MAX_POINTS = 500
+
+_STYLE_LOADED = False
+
+
+@lru_cache(maxsize=128)
+def _blend_over_background(color: str, alpha: float) -> tuple:
+    """Opaque RGB equal to `color` drawn with `alpha` over the axes background."""
+    r, g, b = mcolors.to_rgb(color)
+    br, bg, bb = mcolors.to_rgb(plt.rcParams['axes.facecolor'])
+    return (
+        alpha * r + (1 - alpha) * br,
+        alpha * g + (1 - alpha) * bg,
+        alpha * b + (1 - alpha) * bb,
+    )
+
+
+def _solid(colors, alpha: float):
+    """
+    Opaque equivalent of a color (or list of colors) with transparency.
+    
+    Barras opacas usam o caminho rápido do Agg (sem blending por pixel);
+    a transparência fica só para grades e linhas de referência.
+    """
+    if isinstance(colors, str):
+        return _blend_over_background(colors, alpha)
+    return [_blend_over_background(mcolors.to_hex(c), alpha) for c in colors]
+
+
+@lru_cache(maxsize=64)
+def _cmap_colors(name: str, n: int) -> np.ndarray:
+    """RGBA colors for n items from a named colormap, sampled once per (name, n)."""
+    colors = getattr(plt.cm, name)(np.arange(n))
+    colors.setflags(write=False)  # Compartilhado entre chamadas
+    return colors
+
+
+def _init_style() -> None:
+    """Configure matplotlib for better-looking charts (once per process)."""
+    global _STYLE_LOADED
+    if _STYLE_LOADED:
+        return
+    plt.style.use('seaborn-v0_8-darkgrid')
+    plt.rcParams['figure.figsize'] = (12, 6)
+    plt.rcParams['font.size'] = 10
+    # Grade padrão só no eixo y (gráficos de barras); quem precisa de
+    # outra configuração sobrescreve no próprio eixo
+    plt.rcParams['axes.grid'] = True
+    plt.rcParams['axes.grid.axis'] = 'y'
+    plt.rcParams['grid.alpha'] = 0.3
+    _STYLE_LOADED = True
+
+
 class VisualizationService:
     """Service for creating visual charts and graphs."""
     
-    def __init__(self, output_dir: str = 'reports'):
+    def __init__(self, output_dir: str = 'reports', dpi: int = 150):
         """
         Initialize visualization service.
         
         Args:
             output_dir: Directory to save generated charts
+            dpi: Resolution of saved charts (150 is enough for screen;
+                 use 300 for print exports)
         """
         self.output_dir = output_dir
+        self.dpi = dpi
         os.makedirs(output_dir, exist_ok=True)
         
-        # Configure matplotlib for better-looking charts
-        plt.style.use('seaborn-v0_8-darkgrid')
-        plt.rcParams['figure.figsize'] = (12, 6)
-        plt.rcParams['font.size'] = 10
+        _init_style()
+        
+        # Uma Figure por layout (linhas, colunas, tamanho), reaproveitada
+        # entre chamadas: evita recriar figure + canvas a cada gráfico
+        self._figures: Dict[tuple, Figure] = {}
+    
+    def _get_figure(self, nrows: int = 1, ncols: int = 1, figsize: tuple = (12, 6)):
+        """
+        Return (fig, axes) for the given layout, reusing the cached Figure.
+        
+        The figure is cleared (including twin axes) and its axes rebuilt,
+        so each chart starts from a blank canvas.
+        """
+        key = (nrows, ncols, figsize)
+        fig = self._figures.get(key)
+        if fig is None:
+            # Figure + canvas Agg direto, fora do gerenciador global do
+            # pyplot: sem registro de figuras e seguro em threads/processos
+            fig = self._figures[key] = Figure(figsize=figsize)
+            FigureCanvasAgg(fig)
+        else:
+            fig.clf()
+        return fig, fig.subplots(nrows, ncols)
+    
+    def _chart_path(self, prefix: str, ext: str = 'png') -> str:
+        """Output path '<prefix>_<timestamp>.<ext>' inside output_dir."""
+        return os.path.join(self.output_dir, f'{prefix}_{datetime.now().strftime(_TIMESTAMP_FMT)}.{ext}')
+    
+    @staticmethod
+    def _check_target(save: ChartTarget) -> None:
+        """Reject save=False: charts are rendered off-screen (Agg) and cannot be shown."""
+        if not save:
+            raise ValueError(
+                "Exibição em tela não suportada (backend Agg): use save=True "
+                "ou passe um arquivo/buffer binário"
+            )
+    
+    @staticmethod
+    def _formats(save: ChartTarget, file_format: ChartFormats) -> Tuple[str, ...]:
+        """
+        Normalize file_format to a tuple of formats.
+        
+        A file-like object holds a single image, so it only accepts one
+        format; raises ValueError instead of silently dropping the rest.
+        """
+        formats = (file_format,) if isinstance(file_format, str) else tuple(file_format)
+        if hasattr(save, 'write') and len(formats) != 1:
+            raise ValueError(
+                f"Um buffer recebe um único formato, não {formats}: "
+                "use save=True para salvar vários formatos"
+            )
+        return formats
+    
+    def _output(self, fig, save: ChartTarget, prefix: str, file_format: ChartFormats = 'png') -> ChartResult:
+        """
+        Deliver a finished figure: into a file-like object or to a
+        timestamped file in output_dir.
+        
+        file_format may be a tuple ('png', 'pdf'): the same figure is
+        saved once per format (same timestamp) and the list of paths is
+        returned, so the plot is not rebuilt for each export. A
+        file-like save takes exactly one format (ValueError otherwise).
+        """
+        formats = self._formats(save, file_format)
+        if hasattr(save, 'write'):
+            fig.savefig(save, format=formats[0], dpi=self.dpi)
+            return save
+        self._check_target(save)
+        stem = os.path.splitext(self._chart_path(prefix))[0]
+        paths = []
+        for fmt in formats:
+            fig.savefig(f'{stem}.{fmt}', format=fmt, dpi=self.dpi)
+            paths.append(f'{stem}.{fmt}')
+        return paths[0] if isinstance(file_format, str) else paths
+    
+    def _write_svg(self, svg: str, save: ChartTarget, prefix: str,
+                   file_format: ChartFormats = 'svg') -> ChartResult:
+        """
+        Write an SVG document to the file-like object or to output_dir.
+        
+        Same rule as _output: a file-like save takes exactly one format.
+        """
+        self._formats(save, file_format)
+        data = svg.encode('utf-8')
+        if hasattr(save, 'write'):
+            save.write(data)
+            return save
+        self._check_target(save)
+        filepath = self._chart_path(prefix, 'svg')
+        with open(filepath, 'wb') as f:
+            f.write(data)
+        return filepath
+    
+    @staticmethod
+    def _render_pie_svg(labels: List[str], values: List[float], title: str,
+                        colors: List[str], size: int = 600) -> str:
+        """
+        Pie chart as an SVG string (same layout as ax.pie with
+        startangle=90, counterclockwise, percentage inside each wedge).
+        """
+        total = float(sum(values))
+        cx, cy, r = size / 2, size / 2 + 20, size * 0.32
+        parts = [
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{size}" height="{size + 40}" '
+            f'font-family="DejaVu Sans, sans-serif">',
+            f'<text x="{cx}" y="30" text-anchor="middle" font-size="18" font-weight="bold">{escape(title)}</text>'
+        ]
+        
+        angle = 90.0
+        for label, value, color in zip(labels, values, colors):
+            frac = value / total if total else 0.0
+            if frac <= 0:
+                continue
+            start, angle = angle, angle + frac * 360.0
+            mid = math.radians((start + angle) / 2)
+            
+            if frac >= 1.0:
+                parts.append(f'<circle cx="{cx}" cy="{cy}" r="{r}" fill="{color}"/>')
+            else:
+                # Eixo y do SVG aponta para baixo: sin com sinal invertido
+                x0 = cx + r * math.cos(math.radians(start))
+                y0 = cy - r * math.sin(math.radians(start))
+                x1 = cx + r * math.cos(math.radians(angle))
+                y1 = cy - r * math.sin(math.radians(angle))
+                large = 1 if frac > 0.5 else 0
+                parts.append(
+                    f'<path d="M{cx:.2f},{cy:.2f} L{x0:.2f},{y0:.2f} '
+                    f'A{r:.2f},{r:.2f} 0 {large} 0 {x1:.2f},{y1:.2f} Z" fill="{color}"/>'
+                )
+            
+            px, py = cx + 0.6 * r * math.cos(mid), cy - 0.6 * r * math.sin(mid)
+            lx, ly = cx + 1.1 * r * math.cos(mid), cy - 1.1 * r * math.sin(mid)
+            anchor = 'start' if math.cos(mid) >= 0 else 'end'
+            parts.append(
+                f'<text x="{px:.2f}" y="{py:.2f}" text-anchor="middle" dominant-baseline="middle" '
+                f'font-size="12" font-weight="bold" fill="white">{frac * 100:.1f}%</text>'
+            )
+            parts.append(
+                f'<text x="{lx:.2f}" y="{ly:.2f}" text-anchor="{anchor}" dominant-baseline="middle" '
+                f'font-size="11">{escape(str(label))}</text>'
+            )
+        
+        parts.append('</svg>')
+        return '\n'.join(parts)
+    
+    @staticmethod
+    def _apply_date_axis(axes: list, n_dates: int) -> None:
+        """
+        Format the x axis of several date plots in one pass.
+        
+        The DateFormatter is stateless and shared module-wide; each axis
+        gets its own DayLocator, since a locator reads the limits of the
+        axis it is attached to.
+        """
+        interval = max(1, n_dates // 10)
+        for ax in axes:
+            ax.xaxis.set_major_formatter(_DATE_FMT)
+            ax.xaxis.set_major_locator(mdates.DayLocator(interval=interval))
+            plt.setp(ax.xaxis.get_majorticklabels(), rotation=45, ha='right')
+    
+    @staticmethod
+    def _rasterize(artists) -> None:
+        """
+        Render the given artists as bitmap (at savefig dpi) in vector
+        outputs; axes, ticks and text remain vector. No effect on PNG.
+        """
+        for artist in artists:
+            artist.set_rasterized(True)
+    
+    def close(self):
+        """Release all cached figures."""
+        for fig in self._figures.values():
+            fig.clf()
+        self._figures.clear()
     
-    def plot_sales_trend(self, trend_data: Dict, save: bool = True) -> str:
+    def plot_sales_trend(self, trend_data: Dict, save: ChartTarget = True, file_format: ChartFormats = 'png') -> ChartResult:
         """
         Create sales trend line chart.
         
         Args:
             trend_data: Sales trend data from analytics service
-            save: Whether to save the chart
+            save: True to save to output_dir, or a binary file-like
+                object (e.g. BytesIO) to write the image into
+            file_format: 'png' or a vector format ('pdf', 'svg'); the
+                data artists are rasterized, axes and text stay vector.
+                A tuple ('png', 'pdf') saves every format from one figure
             
         Returns:
-            Path to saved chart file
+            Path to saved chart file (list of paths for a tuple of
+            formats), the given file-like object, or None if there is no data
         """
         daily_data = trend_data['daily_data']
         
@@ -47,66 +304,75 @@ class VisualizationService:
             return None
         
         # Prepare data
-        dates = [datetime.strptime(d['date'], '%d/%m/%Y') for d in daily_data]
+        # Conversão vetorizada (uma chamada) em vez de strptime por dia
+        dates = pd.to_datetime([d['date'] for d in daily_data], format='%d/%m/%Y')
         revenues = [d['revenue'] for d in daily_data]
         sales_counts = [d['sales_count'] for d in daily_data]
+        n_days = len(dates)
+        
+        # Períodos longos: médias semanais. Acima de algumas centenas de
+        # pontos os marcadores se sobrepõem e o custo é só de pixels ocultos.
+        weekly = n_days > TREND_MAX_POINTS
+        if weekly:
+            resampled = pd.DataFrame(
+                {'revenue': revenues, 'sales_count': sales_counts}, index=dates
+            ).resample('W').mean().dropna()
+            dates = resampled.index
+            revenues = resampled['revenue'].to_numpy()
+            sales_counts = resampled['sales_count'].to_numpy()
         
         # Create figure with two subplots
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 10))
+        fig, (ax1, ax2) = self._get_figure(2, 1, figsize=(14, 10))
         
         # Plot 1: Revenue trend
-        ax1.plot(dates, revenues, marker='o', linewidth=2, color='#2ecc71', label='Receita')
-        ax1.fill_between(dates, revenues, alpha=0.3, color='#2ecc71')
+        line, = ax1.plot(dates, revenues, marker=None if weekly else 'o',
+                         linewidth=2, color='#2ecc71', label='Receita')
+        fill = ax1.fill_between(dates, revenues, alpha=0.3, color='#2ecc71')
         ax1.set_title(f'Tendência de Receita - {trend_data["period"]}', fontsize=16, fontweight='bold')
         ax1.set_xlabel('Data', fontsize=12)
         ax1.set_ylabel('Receita (R$)', fontsize=12)
-        ax1.grid(True, alpha=0.3)
+        ax1.grid(True, axis='both')  # Grade completa na linha de tendência
         ax1.legend(fontsize=10)
         
         # Format y-axis as currency
-        ax1.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'R$ {x:,.0f}'))
-        
-        # Format x-axis dates
-        ax1.xaxis.set_major_formatter(mdates.DateFormatter('%d/%m'))
-        ax1.xaxis.set_major_locator(mdates.DayLocator(interval=max(1, len(dates)//10)))
-        plt.setp(ax1.xaxis.get_majorticklabels(), rotation=45, ha='right')
+        ax1.yaxis.set_major_formatter(_BRL_FMT)
         
         # Plot 2: Sales count
-        ax2.bar(dates, sales_counts, color='#3498db', alpha=0.7, label='Número de Vendas')
-        ax2.set_title('Número de Vendas por Dia', fontsize=16, fontweight='bold')
+        bars = ax2.bar(dates, sales_counts, width=7 if weekly else 0.8,
+                       color=_solid('#3498db', 0.7), label='Número de Vendas')
+        
+        # Artistas pesados (um ponto/barra por dia) viram bitmap em PDF/SVG
+        self._rasterize([line, fill, *bars])
+        
+        ax2.set_title('Número de Vendas por Dia' + (' (média semanal)' if weekly else ''),
+                      fontsize=16, fontweight='bold')
         ax2.set_xlabel('Data', fontsize=12)
         ax2.set_ylabel('Quantidade de Vendas', fontsize=12)
-        ax2.grid(True, alpha=0.3, axis='y')
         ax2.legend(fontsize=10)
         
-        # Format x-axis dates
-        ax2.xaxis.set_major_formatter(mdates.DateFormatter('%d/%m'))
-        ax2.xaxis.set_major_locator(mdates.DayLocator(interval=max(1, len(dates)//10)))
-        plt.setp(ax2.xaxis.get_majorticklabels(), rotation=45, ha='right')
+        # Format x-axis dates (mesma configuração nos dois gráficos)
+        self._apply_date_axis([ax1, ax2], n_days)
         
-        plt.tight_layout()
+        fig.tight_layout()
         
-        # Save or show
-        if save:
-            filename = f'tendencia_vendas_{datetime.now().strftime("%Y%m%d_%H%M%S")}.png'
-            filepath = os.path.join(self.output_dir, filename)
-            plt.savefig(filepath, dpi=300, bbox_inches='tight')
-            plt.close()
-            return filepath
-        else:
-            plt.show()
-            return None
+        return self._output(fig, save, 'tendencia_vendas', file_format)
     
-    def plot_category_distribution(self, category_data: Dict, save: bool = True) -> str:
+    def plot_category_distribution(self, category_data: Dict, save: ChartTarget = True,
+                                   file_format: ChartFormats = 'png') -> ChartResult:
         """
         Create category distribution pie chart.
         
         Args:
             category_data: Category analysis data
-            save: Whether to save the chart
+            save: True to save to output_dir, or a binary file-like
+                object (e.g. BytesIO) to write the image into
+            file_format: 'png' (matplotlib) or 'svg' (rendered directly
+                from a template, without matplotlib); a tuple of formats
+                saves each one from the same matplotlib figure
             
         Returns:
-            Path to saved chart file
+            Path to saved chart file (list of paths for a tuple of
+            formats), the given file-like object, or None if there is no data
         """
         categories = category_data['categories']
         
@@ -116,12 +382,20 @@ class VisualizationService:
         # Prepare data
         labels = [c['category'] for c in categories]
         revenues = [c['revenue'] for c in categories]
+        colors = _cmap_colors('Set3', len(labels))
+        
+        # Pizza simples: em SVG não precisa do pipeline do matplotlib
+        if file_format == 'svg' and save is not False:
+            svg = self._render_pie_svg(
+                labels, revenues, 'Distribuição de Receita por Categoria',
+                [mcolors.to_hex(c) for c in colors]
+            )
+            return self._write_svg(svg, save, 'distribuicao_categorias', file_format)
         
         # Create figure
-        fig, ax = plt.subplots(figsize=(12, 8))
+        fig, ax = self._get_figure(figsize=(12, 8))
         
         # Create pie chart
-        colors = plt.cm.Set3(range(len(labels)))
         wedges, texts, autotexts = ax.pie(
             revenues,
             labels=labels,
@@ -139,30 +413,26 @@ class VisualizationService:
         
         ax.set_title('Distribuição de Receita por Categoria', fontsize=16, fontweight='bold', pad=20)
         
-        plt.tight_layout()
+        fig.tight_layout()
         
-        # Save or show
-        if save:
-            filename = f'distribuicao_categorias_{datetime.now().strftime("%Y%m%d_%H%M%S")}.png'
-            filepath = os.path.join(self.output_dir, filename)
-            plt.savefig(filepath, dpi=300, bbox_inches='tight')
-            plt.close()
-            return filepath
-        else:
-            plt.show()
-            return None
+        return self._output(fig, save, 'distribuicao_categorias', file_format)
     
-    def plot_top_products(self, products: List[Dict], top_n: int = 10, save: bool = True) -> str:
+    def plot_top_products(self, products: List[Dict], top_n: int = 10, save: ChartTarget = True,
+                          file_format: ChartFormats = 'png') -> ChartResult:
         """
         Create top products bar chart.
         
         Args:
             products: Product performance data
             top_n: Number of products to show
-            save: Whether to save the chart
+            save: True to save to output_dir, or a binary file-like
+                object (e.g. BytesIO) to write the image into
+            file_format: image format, or a tuple of formats saved from
+                the same figure (returns the list of paths)
             
         Returns:
-            Path to saved chart file
+            Path to saved chart file (list of paths for a tuple of
+            formats), the given file-like object, or None if there is no data
         """
         if not products:
             return None
@@ -171,20 +441,22 @@ class VisualizationService:
         top_products = products[:top_n]
         
         # Prepare data
-        product_names = [p['produto'][:20] for p in top_products]  # Truncate long names
-        revenues = [p['revenue'] for p in top_products]
-        profits = [p['profit'] for p in top_products]
+        # Truncate long names: o dtype de largura fixa corta em C
+        product_names = np.array([p['produto'] for p in top_products], dtype='<U20')
+        # Colunas numéricas extraídas em uma passada (receita, lucro)
+        values = np.array([(p['revenue'], p['profit']) for p in top_products], dtype=np.float64)
+        revenues, profits = values[:, 0], values[:, 1]
         
         # Create figure
-        fig, ax = plt.subplots(figsize=(14, 8))
+        fig, ax = self._get_figure(figsize=(14, 8))
         
         # Create horizontal bar chart
-        y_pos = range(len(product_names))
+        y_pos = np.arange(len(product_names))
         
-        bars1 = ax.barh([i - 0.2 for i in y_pos], revenues, 0.4, 
-                        label='Receita', color='#3498db', alpha=0.8)
-        bars2 = ax.barh([i + 0.2 for i in y_pos], profits, 0.4,
-                        label='Lucro', color='#2ecc71', alpha=0.8)
+        bars1 = ax.barh(y_pos - 0.2, revenues, 0.4, 
+                        label='Receita', color=_solid('#3498db', 0.8))
+        bars2 = ax.barh(y_pos + 0.2, profits, 0.4,
+                        label='Lucro', color=_solid('#2ecc71', 0.8))
         
         ax.set_yticks(y_pos)
         ax.set_yticklabels(product_names)
@@ -192,34 +464,30 @@ class VisualizationService:
         ax.set_xlabel('Valor (R$)', fontsize=12)
         ax.set_title(f'Top {top_n} Produtos - Receita e Lucro', fontsize=16, fontweight='bold')
         ax.legend(fontsize=11)
-        ax.grid(True, alpha=0.3, axis='x')
+        ax.grid(True, axis='x')  # Barras horizontais: grade também no eixo x
         
         # Format x-axis as currency
-        ax.xaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'R$ {x:,.0f}'))
+        ax.xaxis.set_major_formatter(_BRL_FMT)
         
-        plt.tight_layout()
+        fig.tight_layout()
         
-        # Save or show
-        if save:
-            filename = f'top_produtos_{datetime.now().strftime("%Y%m%d_%H%M%S")}.png'
-            filepath = os.path.join(self.output_dir, filename)
-            plt.savefig(filepath, dpi=300, bbox_inches='tight')
-            plt.close()
-            return filepath
-        else:
-            plt.show()
-            return None
+        return self._output(fig, save, 'top_produtos', file_format)
     
-    def plot_customer_segments(self, segments: Dict, save: bool = True) -> str:
+    def plot_customer_segments(self, segments: Dict, save: ChartTarget = True,
+                               file_format: ChartFormats = 'png') -> ChartResult:
         """
         Create customer segmentation visualization.
         
         Args:
             segments: Customer segmentation data
-            save: Whether to save the chart
+            save: True to save to output_dir, or a binary file-like
+                object (e.g. BytesIO) to write the image into
+            file_format: image format, or a tuple of formats saved from
+                the same figure (returns the list of paths)
             
         Returns:
-            Path to saved chart file
+            Path to saved chart file (list of paths for a tuple of
+            formats) or the given file-like object
         """
         summary = segments['summary']
         
@@ -239,63 +507,49 @@ class VisualizationService:
         ]
         
         # Create figure with two subplots
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
+        fig, (ax1, ax2) = self._get_figure(1, 2, figsize=(16, 6))
         
         # Plot 1: Customer count by segment
         colors = ['#f39c12', '#2ecc71', '#3498db', '#95a5a6']
-        bars = ax1.bar(segment_names, counts, color=colors, alpha=0.8)
+        bars = ax1.bar(segment_names, counts, color=_solid(colors, 0.8))
         ax1.set_title('Distribuição de Clientes por Segmento', fontsize=14, fontweight='bold')
         ax1.set_ylabel('Número de Clientes', fontsize=12)
-        ax1.grid(True, alpha=0.3, axis='y')
         
         # Add value labels on bars
-        for bar in bars:
-            height = bar.get_height()
-            ax1.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{int(height)}',
-                    ha='center', va='bottom', fontsize=11, fontweight='bold')
+        ax1.bar_label(bars, fmt='%d', fontsize=11, fontweight='bold')
         
         # Plot 2: Revenue by segment (only VIP and Regular)
         segment_names_rev = ['VIP', 'Regular']
         revenues_filtered = [revenues[0], revenues[1]]
         
         bars2 = ax2.bar(segment_names_rev, revenues_filtered, 
-                       color=[colors[0], colors[1]], alpha=0.8)
+                       color=_solid([colors[0], colors[1]], 0.8))
         ax2.set_title('Receita por Segmento', fontsize=14, fontweight='bold')
         ax2.set_ylabel('Receita (R$)', fontsize=12)
-        ax2.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'R$ {x:,.0f}'))
-        ax2.grid(True, alpha=0.3, axis='y')
+        ax2.yaxis.set_major_formatter(_BRL_FMT)
         
         # Add value labels
-        for bar in bars2:
-            height = bar.get_height()
-            ax2.text(bar.get_x() + bar.get_width()/2., height,
-                    f'R$ {height:,.0f}',
-                    ha='center', va='bottom', fontsize=11, fontweight='bold')
-        
-        plt.tight_layout()
-        
-        # Save or show
-        if save:
-            filename = f'segmentacao_clientes_{datetime.now().strftime("%Y%m%d_%H%M%S")}.png'
-            filepath = os.path.join(self.output_dir, filename)
-            plt.savefig(filepath, dpi=300, bbox_inches='tight')
-            plt.close()
-            return filepath
-        else:
-            plt.show()
-            return None
+        ax2.bar_label(bars2, fmt='R$ {:,.0f}', fontsize=11, fontweight='bold')
+        
+        fig.tight_layout()
+        
+        return self._output(fig, save, 'segmentacao_clientes', file_format)
     
-    def plot_payment_methods(self, payment_data: Dict, save: bool = True) -> str:
+    def plot_payment_methods(self, payment_data: Dict, save: ChartTarget = True,
+                             file_format: ChartFormats = 'png') -> ChartResult:
         """
         Create payment methods analysis chart.
         
         Args:
             payment_data: Payment method data
-            save: Whether to save the chart
+            save: True to save to output_dir, or a binary file-like
+                object (e.g. BytesIO) to write the image into
+            file_format: image format, or a tuple of formats saved from
+                the same figure (returns the list of paths)
             
         Returns:
-            Path to saved chart file
+            Path to saved chart file (list of paths for a tuple of
+            formats), the given file-like object, or None if there is no data
         """
         methods = payment_data['payment_methods']
         
@@ -304,14 +558,15 @@ class VisualizationService:
         
         # Prepare data
         method_names = [m['payment_method'] for m in methods]
-        revenues = [m['revenue'] for m in methods]
-        counts = [m['transaction_count'] for m in methods]
+        # Colunas numéricas extraídas em uma passada (receita, transações)
+        values = np.array([(m['revenue'], m['transaction_count']) for m in methods], dtype=np.float64)
+        revenues, counts = values[:, 0], values[:, 1]
         
         # Create figure with two subplots
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
+        fig, (ax1, ax2) = self._get_figure(1, 2, figsize=(16, 6))
         
         # Plot 1: Revenue by payment method (pie chart)
-        colors = plt.cm.Pastel1(range(len(method_names)))
+        colors = _cmap_colors('Pastel1', len(method_names))
         wedges, texts, autotexts = ax1.pie(
             revenues,
             labels=method_names,
@@ -329,46 +584,37 @@ class VisualizationService:
                      fontsize=14, fontweight='bold')
         
         # Plot 2: Transaction count (bar chart)
-        bars = ax2.bar(method_names, counts, color=colors, alpha=0.8)
+        bars = ax2.bar(method_names, counts, color=_solid(colors, 0.8))
         ax2.set_title('Número de Transações por Meio de Pagamento',
                      fontsize=14, fontweight='bold')
         ax2.set_ylabel('Número de Transações', fontsize=12)
-        ax2.grid(True, alpha=0.3, axis='y')
         
         # Rotate x-axis labels if needed
         if len(method_names) > 3:
             plt.setp(ax2.xaxis.get_majorticklabels(), rotation=45, ha='right')
         
         # Add value labels
-        for bar in bars:
-            height = bar.get_height()
-            ax2.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{int(height)}',
-                    ha='center', va='bottom', fontsize=11, fontweight='bold')
-        
-        plt.tight_layout()
-        
-        # Save or show
-        if save:
-            filename = f'meios_pagamento_{datetime.now().strftime("%Y%m%d_%H%M%S")}.png'
-            filepath = os.path.join(self.output_dir, filename)
-            plt.savefig(filepath, dpi=300, bbox_inches='tight')
-            plt.close()
-            return filepath
-        else:
-            plt.show()
-            return None
+        ax2.bar_label(bars, fmt='%d', fontsize=11, fontweight='bold')
+        
+        fig.tight_layout()
+        
+        return self._output(fig, save, 'meios_pagamento', file_format)
     
-    def plot_abc_analysis(self, abc_data: Dict, save: bool = True) -> str:
+    def plot_abc_analysis(self, abc_data: Dict, save: ChartTarget = True, file_format: ChartFormats = 'png') -> ChartResult:
         """
         Create ABC analysis Pareto chart.
         
         Args:
             abc_data: ABC analysis data
-            save: Whether to save the chart
+            save: True to save to output_dir, or a binary file-like
+                object (e.g. BytesIO) to write the image into
+            file_format: 'png' or a vector format ('pdf', 'svg'); the
+                bars are rasterized, axes and text stay vector.
+                A tuple ('png', 'pdf') saves every format from one figure
             
         Returns:
-            Path to saved chart file
+            Path to saved chart file (list of paths for a tuple of
+            formats), the given file-like object, or None if there is no data
         """
         all_products = abc_data['all_products']
         
@@ -376,29 +622,26 @@ class VisualizationService:
             return None
         
         # Prepare data (already sorted by revenue)
-        product_names = [p['produto'][:15] for p in all_products[:20]]  # Top 20
-        revenues = [p['revenue'] for p in all_products[:20]]
+        product_names = np.array([p['produto'] for p in all_products[:20]], dtype='<U15')  # Top 20
+        all_revenues = np.fromiter((p['revenue'] for p in all_products), dtype=np.float64, count=len(all_products))
+        revenues = all_revenues[:20]
         
-        # Calculate cumulative percentage
-        total_revenue = sum([p['revenue'] for p in all_products])
-        cumulative_pct = []
-        cumsum = 0
-        for revenue in revenues:
-            cumsum += revenue
-            cumulative_pct.append((cumsum / total_revenue) * 100)
+        # Calculate cumulative percentage (vetorizado)
+        cumulative_pct = np.cumsum(revenues) / all_revenues.sum() * 100.0
         
         # Create figure
-        fig, ax1 = plt.subplots(figsize=(16, 8))
+        fig, ax1 = self._get_figure(figsize=(16, 8))
         
         # Bar chart for revenue
         color = '#3498db'
-        ax1.bar(range(len(product_names)), revenues, color=color, alpha=0.7, label='Receita')
+        bars = ax1.bar(range(len(product_names)), revenues, color=_solid(color, 0.7), label='Receita')
+        self._rasterize(bars)
         ax1.set_xlabel('Produtos', fontsize=12)
         ax1.set_ylabel('Receita (R$)', fontsize=12, color=color)
         ax1.tick_params(axis='y', labelcolor=color)
         ax1.set_xticks(range(len(product_names)))
         ax1.set_xticklabels(product_names, rotation=45, ha='right')
-        ax1.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'R$ {x:,.0f}'))
+        ax1.yaxis.set_major_formatter(_BRL_FMT)
         
         # Line chart for cumulative percentage
         ax2 = ax1.twinx()
@@ -421,31 +664,26 @@ class VisualizationService:
         lines2, labels2 = ax2.get_legend_handles_labels()
         ax1.legend(lines1 + lines2, labels1 + labels2, loc='upper left', fontsize=10)
         
-        ax1.grid(True, alpha=0.3, axis='y')
         
-        plt.tight_layout()
+        fig.tight_layout()
         
-        # Save or show
-        if save:
-            filename = f'analise_abc_{datetime.now().strftime("%Y%m%d_%H%M%S")}.png'
-            filepath = os.path.join(self.output_dir, filename)
-            plt.savefig(filepath, dpi=300, bbox_inches='tight')
-            plt.close()
-            return filepath
-        else:
-            plt.show()
-            return None
+        return self._output(fig, save, 'analise_abc', file_format)
     
-    def plot_profitability_overview(self, profitability: Dict, save: bool = True) -> str:
+    def plot_profitability_overview(self, profitability: Dict, save: ChartTarget = True,
+                                    file_format: ChartFormats = 'png') -> ChartResult:
         """
         Create profitability overview chart.
         
         Args:
             profitability: Profitability report data
-            save: Whether to save the chart
+            save: True to save to output_dir, or a binary file-like
+                object (e.g. BytesIO) to write the image into
+            file_format: image format, or a tuple of formats saved from
+                the same figure (returns the list of paths)
             
         Returns:
-            Path to saved chart file
+            Path to saved chart file (list of paths for a tuple of
+            formats) or the given file-like object
         """
         # Prepare data
         categories = ['Receita\nTotal', 'Custo\nTotal', 'Lucro\nBruto']
@@ -457,21 +695,16 @@ class VisualizationService:
         colors = ['#3498db', '#e74c3c', '#2ecc71']
         
         # Create figure
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
+        fig, (ax1, ax2) = self._get_figure(1, 2, figsize=(16, 6))
         
         # Plot 1: Revenue, Cost, Profit bars
-        bars = ax1.bar(categories, values, color=colors, alpha=0.8, width=0.6)
+        bars = ax1.bar(categories, values, color=_solid(colors, 0.8), width=0.6)
         ax1.set_title('Visão Geral de Lucratividade', fontsize=14, fontweight='bold')
         ax1.set_ylabel('Valor (R$)', fontsize=12)
-        ax1.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'R$ {x:,.0f}'))
-        ax1.grid(True, alpha=0.3, axis='y')
+        ax1.yaxis.set_major_formatter(_BRL_FMT)
         
         # Add value labels
-        for bar in bars:
-            height = bar.get_height()
-            ax1.text(bar.get_x() + bar.get_width()/2., height,
-                    f'R$ {height:,.0f}',
-                    ha='center', va='bottom', fontsize=11, fontweight='bold')
+        ax1.bar_label(bars, fmt='R$ {:,.0f}', fontsize=11, fontweight='bold')
         
         # Plot 2: Margin pie chart
         margin_data = [
@@ -499,15 +732,6 @@ class VisualizationService:
         
         ax2.set_title('Composição da Receita', fontsize=14, fontweight='bold')
         
-        plt.tight_layout()
+        fig.tight_layout()
         
-        # Save or show
-        if save:
-            filename = f'lucratividade_{datetime.now().strftime("%Y%m%d_%H%M%S")}.png'
-            filepath = os.path.join(self.output_dir, filename)
-            plt.savefig(filepath, dpi=300, bbox_inches='tight')
-            plt.close()
-            return filepath
-        else:
-            plt.show()
-            return None
\ No newline at end of file
+        return self._output(fig, save, 'lucratividade', file_format)
\ No newline at end of file
@@ -5,8 +5,60 @@ Functions to visualize analytics data in the terminal with
 ASCII charts, tables, and formatted reports.
 """
 
+from functools import lru_cache
+from operator import itemgetter
 from typing import List, Dict
 import math
+import sys
+
+import numpy as np
+
+
+# Barras prontas: cada barra é uma fatia (cópia em C) em vez de "█" * n
+_BAR_MAX = 512
+_FULL_BAR = "█" * _BAR_MAX
+
+# Linhas do gráfico de tendência (10 no topo até 0) e caracteres vazio/cheio
+_TREND_ROWS = np.arange(10, -1, -1)
+_TREND_CELLS = np.array([" ", "█"])
+
+# Separadores e cabeçalhos fixos, criados uma vez
+_SEP70 = "=" * 70
+_HEADER_COMPARE = f"\n{_SEP70}\n  COMPARAÇÃO DE PERÍODOS\n{_SEP70}"
+
+# Valor de um par (rótulo, valor) de print_bar_chart, projetado em C
+_GET_VALUE = itemgetter(1)
+
+# Seta de variação indexada pelo sinal (-1, 0, +1)
+_ARROW = ("📉", "→", "📈")
+
+# Bloco de um produto em print_product_performance
+_PRODUCT_TMPL = (
+    "\n{i}. {produto} ({codigo})\n"
+    "   Categoria: {categoria}\n"
+    "   Quantidade Vendida: {quantity_sold} unidades\n"
+    "   Receita: R$ {revenue:.2f}\n"
+    "   Lucro: R$ {profit:.2f} (Margem: {profit_margin:.1f}%)\n"
+    "   Transações: {transactions} | Clientes Únicos: {unique_customers}\n"
+    "   Taxa de Giro: {turnover_rate:.1f}% | Estoque Atual: {current_stock}\n"
+)
+
+
+@lru_cache(maxsize=128)
+def _bar(length: int) -> str:
+    """
+    Bar of `length` blocks, sliced from the precomputed string.
+    
+    Memoized: percentage bars (0-50 blocks) repeat across reports.
+    """
+    if 0 <= length <= _BAR_MAX:
+        return _FULL_BAR[:length]
+    return "█" * length
+
+
+def _arrow(change: float) -> str:
+    """Up/down/flat arrow for a percentage change."""
+    return _ARROW[(change > 0) - (change < 0) + 1]
 
 
 def print_bar_chart(data: List[tuple], title: str, max_width: int = 50):
@@ -22,21 +74,22 @@ def print_bar_chart(data: List[tuple], title: str, max_width: int = 50):
         print("\nNenhum dado para exibir.")
         return
     
-    print(f"\n{title}")
-    print("="*70)
+    # Gráfico inteiro montado em memória e escrito de uma vez
+    lines = ["", title, _SEP70]
     
-    # Find max value for scaling
-    max_value = max(v for _, v in data)
+    # Max e comprimentos de todas as barras calculados de uma vez
+    values = np.fromiter(map(_GET_VALUE, data), dtype=np.float64, count=len(data))
+    max_value = values.max()
     
-    for label, value in data:
-        # Calculate bar length
-        if max_value > 0:
-            bar_length = int((value / max_value) * max_width)
-        else:
-            bar_length = 0
-        
+    if max_value > 0:
+        bar_lengths = (values / max_value * max_width).astype(np.intp).tolist()
+    else:
+        bar_lengths = [0] * len(data)
+    
+    # Valores originais (não os do array) para manter int vs float no texto
+    for (label, value), bar_length in zip(data, bar_lengths):
         # Create bar
-        bar = "█" * bar_length
+        bar = _bar(bar_length)
         
         # Format value
         if isinstance(value, float):
@@ -44,7 +97,10 @@ def print_bar_chart(data: List[tuple], title: str, max_width: int = 50):
         else:
             value_str = str(value)
         
-        print(f"{label[:25]:<25} {bar} {value_str}")
+        lines.append(f"{label[:25]:<25} {bar} {value_str}")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
 def print_trend_chart(data: List[Dict], value_key: str, label_key: str = 'date', title: str = "Tendência"):
@@ -61,48 +117,44 @@ def print_trend_chart(data: List[Dict], value_key: str, label_key: str = 'date',
         print("\nNenhum dado para exibir.")
         return
     
-    print(f"\n{title}")
-    print("="*70)
+    # Gráfico inteiro montado em memória e escrito de uma vez
+    lines = ["", title, _SEP70]
     
     # Extract values
-    values = [d[value_key] for d in data]
-    labels = [d[label_key] for d in data]
+    values = np.fromiter(map(itemgetter(value_key), data), dtype=np.float64, count=len(data))
+    labels = list(map(itemgetter(label_key), data))
     
-    # Normalize values to 0-10 scale for chart
-    max_val = max(values) if values else 1
-    min_val = min(values) if values else 0
+    # Normalize values to 0-10 scale for chart (vetorizado)
+    max_val = values.max()
+    min_val = values.min()
     
     if max_val == min_val:
-        normalized = [5] * len(values)
+        normalized = np.full(len(values), 5)
     else:
-        normalized = [int((v - min_val) / (max_val - min_val) * 10) for v in values]
-    
-    # Print chart (10 rows)
-    for row in range(10, -1, -1):
-        line = f"{row:2} |"
-        for norm_val in normalized:
-            if norm_val >= row:
-                line += "█"
-            else:
-                line += " "
-        print(line)
+        normalized = ((values - min_val) / (max_val - min_val) * 10).astype(np.intp)
+    
+    # Print chart (10 rows): grade booleana linha x ponto montada de uma vez;
+    # cada linha da matriz de caracteres é lida como uma única string
+    grid = _TREND_CELLS[(normalized[None, :] >= _TREND_ROWS[:, None]).astype(np.intp)]
+    rows = grid.view(f"<U{len(normalized)}").ravel()
+    for row, cells in zip(_TREND_ROWS, rows):
+        lines.append(f"{row:2} |{cells}")
     
     # Print x-axis
-    print("   " + "-" * len(values))
+    lines.append("   " + "-" * len(values))
     
     # Print labels (show every nth label to avoid crowding)
     step = max(1, len(labels) // 10)
-    label_line = "    "
-    for i, label in enumerate(labels):
-        if i % step == 0:
-            # Shorten label
-            short_label = label[-5:] if len(label) > 5 else label
-            label_line += short_label[:5].ljust(step + 1)
-    
-    print(label_line)
+    # Só os rótulos exibidos, encurtados aos 5 últimos caracteres e
+    # alinhados por um template de largura fixa montado uma vez
+    pad = f"{{:<{step + 1}}}".format
+    lines.append("    " + "".join(pad(label[-5:]) for label in labels[::step]))
     
     # Print legend
-    print(f"\nMin: {min_val:.2f} | Max: {max_val:.2f}")
+    lines.append(f"\nMin: {min_val:.2f} | Max: {max_val:.2f}")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
 def print_comparison(period1: Dict, period2: Dict, changes: Dict):
@@ -114,9 +166,7 @@ def print_comparison(period1: Dict, period2: Dict, changes: Dict):
         period2: Previous period data
         changes: Change percentages
     """
-    print("\n" + "="*70)
-    print("  COMPARAÇÃO DE PERÍODOS")
-    print("="*70)
+    print(_HEADER_COMPARE)
     
     print(f"\nPeríodo Recente ({period1['days']} dias):")
     print(f"  Vendas: {period1['sales_count']}")
@@ -130,22 +180,16 @@ def print_comparison(period1: Dict, period2: Dict, changes: Dict):
     print(f"  Itens: {period2['items_sold']}")
     print(f"  Ticket Médio: R$ {period2['avg_ticket']:.2f}")
     
-    print("\nVariação:")
-    
-    # Revenue change
     revenue_change = changes['revenue_change_pct']
-    revenue_arrow = "📈" if revenue_change > 0 else "📉" if revenue_change < 0 else "→"
-    print(f"  {revenue_arrow} Receita: {revenue_change:+.1f}%")
-    
-    # Sales change
     sales_change = changes['sales_change_pct']
-    sales_arrow = "📈" if sales_change > 0 else "📉" if sales_change < 0 else "→"
-    print(f"  {sales_arrow} Vendas: {sales_change:+.1f}%")
-    
-    # Items change
     items_change = changes['items_change_pct']
-    items_arrow = "📈" if items_change > 0 else "📉" if items_change < 0 else "→"
-    print(f"  {items_arrow} Itens: {items_change:+.1f}%")
+    
+    sys.stdout.write(
+        "\nVariação:\n"
+        f"  {_arrow(revenue_change)} Receita: {revenue_change:+.1f}%\n"
+        f"  {_arrow(sales_change)} Vendas: {sales_change:+.1f}%\n"
+        f"  {_arrow(items_change)} Itens: {items_change:+.1f}%\n"
+    )
 
 
 def print_abc_analysis(abc_data: Dict):
@@ -155,9 +199,9 @@ def print_abc_analysis(abc_data: Dict):
     Args:
         abc_data: ABC classification data
     """
-    print("\n" + "="*70)
+    print("\n" + _SEP70)
     print("  ANÁLISE ABC (Curva de Pareto)")
-    print("="*70)
+    print(_SEP70)
     
     summary = abc_data['summary']
     
@@ -187,9 +231,9 @@ def print_customer_segments(segments: Dict):
     Args:
         segments: Customer segment data
     """
-    print("\n" + "="*70)
+    print("\n" + _SEP70)
     print("  SEGMENTAÇÃO DE CLIENTES")
-    print("="*70)
+    print(_SEP70)
     
     summary = segments['summary']
     
@@ -222,9 +266,9 @@ def print_profitability_report(report: Dict):
     Args:
         report: Profitability data
     """
-    print("\n" + "="*70)
+    print("\n" + _SEP70)
     print("  RELATÓRIO DE LUCRATIVIDADE")
-    print("="*70)
+    print(_SEP70)
     
     print(f"\n💰 Receita Total: R$ {report['total_revenue']:.2f}")
     print(f"💸 Custo Total: R$ {report['total_cost']:.2f}")
@@ -238,8 +282,7 @@ def print_profitability_report(report: Dict):
     
     # Visualize profit margin
     margin = report['profit_margin_pct']
-    bar_length = int(margin / 2)  # Scale to 50 chars for 100%
-    bar = "█" * bar_length
+    bar = _bar(int(margin / 2))  # Scale to 50 chars for 100%
     
     print(f"\nMargem de Lucro Visual:")
     print(f"0%  {bar} {margin:.1f}%  100%")
@@ -252,9 +295,9 @@ def print_category_performance(category_data: Dict):
     Args:
         category_data: Category analysis data
     """
-    print("\n" + "="*70)
+    print("\n" + _SEP70)
     print("  DESEMPENHO POR CATEGORIA")
-    print("="*70)
+    print(_SEP70)
     
     categories = category_data['categories']
     
@@ -266,9 +309,7 @@ def print_category_performance(category_data: Dict):
               f"Produtos: {cat['unique_products']}")
         
         # Bar for revenue share
-        bar_length = int(cat['revenue_share'] / 2)
-        bar = "█" * bar_length
-        print(f"   {bar}")
+        print(f"   {_bar(int(cat['revenue_share'] / 2))}")
 
 
 def print_product_performance(products: List[Dict], top_n: int = 10):
@@ -279,18 +320,14 @@ def print_product_performance(products: List[Dict], top_n: int = 10):
         products: Product performance data
         top_n: Number of products to show
     """
-    print("\n" + "="*70)
+    print("\n" + _SEP70)
     print(f"  TOP {top_n} PRODUTOS - ANÁLISE DETALHADA")
-    print("="*70)
+    print(_SEP70)
     
-    for i, product in enumerate(products[:top_n], 1):
-        print(f"\n{i}. {product['produto']} ({product['codigo']})")
-        print(f"   Categoria: {product['categoria']}")
-        print(f"   Quantidade Vendida: {product['quantity_sold']} unidades")
-        print(f"   Receita: R$ {product['revenue']:.2f}")
-        print(f"   Lucro: R$ {product['profit']:.2f} (Margem: {product['profit_margin']:.1f}%)")
-        print(f"   Transações: {product['transactions']} | Clientes Únicos: {product['unique_customers']}")
-        print(f"   Taxa de Giro: {product['turnover_rate']:.1f}% | Estoque Atual: {product['current_stock']}")
+    sys.stdout.write("".join(
+        _PRODUCT_TMPL.format(i=i, **product)
+        for i, product in enumerate(products[:top_n], 1)
+    ))
 
 
 def print_clv_analysis(clv_data: List[Dict]):
@@ -300,9 +337,9 @@ def print_clv_analysis(clv_data: List[Dict]):
     Args:
         clv_data: CLV data
     """
-    print("\n" + "="*70)
+    print("\n" + _SEP70)
     print("  LIFETIME VALUE (CLV) - TOP CLIENTES")
-    print("="*70)
+    print(_SEP70)
     
     print("\n💎 Clientes com Maior Valor Vitalício:")
     
@@ -322,9 +359,9 @@ def print_payment_analysis(payment_data: Dict):
     Args:
         payment_data: Payment method data
     """
-    print("\n" + "="*70)
+    print("\n" + _SEP70)
     print("  ANÁLISE POR MEIO DE PAGAMENTO")
-    print("="*70)
+    print(_SEP70)
     
     methods = payment_data['payment_methods']
     
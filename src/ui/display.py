@@ -5,8 +5,54 @@ This module provides functions to display products, clients, and sales
 in a user-friendly table format.
 """
 
+import sys
+from contextlib import contextmanager
 from typing import List, Dict
 
+import numpy as np
+
+
+# A partir de quantas vendas display_sales formata a tabela por coluna
+SALES_VECTORIZE_MIN = 500
+
+# Separadores fixos, criados uma vez
+_SEP60 = "=" * 60
+_DASHES: Dict[int, str] = {}
+
+
+@contextmanager
+def batched_output():
+    """
+    Block-buffer stdout for the duration of the block, flushing once at exit.
+    
+    For renderers that build one frame with several print() calls (the
+    detail views): with a line-buffered (TTY) or write-through
+    (PYTHONUNBUFFERED) stdout each print would be its own write. Tables
+    are already written in one go by print_table.
+    """
+    stream = sys.stdout
+    reconfigure = getattr(stream, 'reconfigure', None)
+    if reconfigure is None:
+        # stdout substituído (ex.: captura em testes): nada a ajustar
+        yield
+        return
+    
+    line_buffering, write_through = stream.line_buffering, stream.write_through
+    reconfigure(line_buffering=False, write_through=False)
+    try:
+        yield
+    finally:
+        stream.flush()
+        reconfigure(line_buffering=line_buffering, write_through=write_through)
+
+
+def _dash(width: int) -> str:
+    """Run of `width` dashes, built once per width."""
+    dash = _DASHES.get(width)
+    if dash is None:
+        dash = _DASHES[width] = "-" * width
+    return dash
+
 
 def print_table_header(columns: List[tuple[str, int]]):
     """
@@ -20,7 +66,7 @@ def print_table_header(columns: List[tuple[str, int]]):
     print("\n" + header)
     
     # Print separator
-    separator = "-+-".join("-" * width for _, width in columns)
+    separator = "-+-".join(_dash(width) for _, width in columns)
     print(separator)
 
 
@@ -36,6 +82,65 @@ def print_table_row(values: List[str], widths: List[int]):
     print(row)
 
 
+def print_table(columns: List[tuple[str, int]], rows: List[list]):
+    """
+    Print a whole table (header, separator and rows) in a single write.
+    
+    Args:
+        columns: List of (column_name, width) tuples
+        rows: List of value lists, one per row
+    """
+    # Template montado uma vez; cada linha é um único str.format
+    fmt = " | ".join(f"{{:<{width}}}" for _, width in columns).format
+    
+    lines = _table_head(columns)
+    lines.extend(fmt(*map(str, values)) for values in rows)
+    
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _table_head(columns: List[tuple[str, int]]) -> List[str]:
+    """Leading blank line, header and separator lines of a table."""
+    return [
+        "",
+        " | ".join(name.ljust(width) for name, width in columns),
+        "-+-".join(_dash(width) for _, width in columns),
+    ]
+
+
+def _print_sales_table_vectorized(columns: List[tuple[str, int]], sales: List[Dict]):
+    """
+    Same table as print_table for display_sales, formatted column-wise.
+    
+    Truncation, capitalization, currency formatting and padding run as
+    NumPy string operations over whole columns instead of per cell.
+    """
+    ids, datas, clientes, produtos, qtds, totals, meios = zip(*(
+        (s.get('ID_VENDA', ''), s.get('DATA', ''), s.get('CLIENTE', ''), s.get('PRODUTO', ''),
+         s.get('QUANTIDADE', '0'), s.get('PRECO_TOTAL', 0), s.get('MEIO', ''))
+        for s in sales
+    ))
+    
+    cols = [
+        np.array(ids, dtype=str),
+        np.array(datas, dtype=str),
+        np.array(clientes, dtype=str).astype('<U18'),
+        np.array(produtos, dtype=str).astype('<U18'),
+        np.array(qtds, dtype=str),
+        np.char.mod("R$ %.2f", np.array(totals, dtype=np.float64)),
+        np.char.capitalize(np.array(meios, dtype=str)).astype('<U8'),
+    ]
+    
+    table = None
+    for col, (_, width) in zip(cols, columns):
+        col = np.char.ljust(col, width)
+        table = col if table is None else np.char.add(np.char.add(table, " | "), col)
+    
+    lines = _table_head(columns)
+    lines.extend(table.tolist())
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
 def display_products(products: List[Dict], show_all: bool = True):
     """
     Display products in a formatted table.
@@ -65,9 +170,8 @@ def display_products(products: List[Dict], show_all: bool = True):
         ("Estoque", 8)
     ]
     
-    print_table_header(columns)
-    
     # Print rows
+    rows = []
     for p in products:
         custo = float(p.get('CUSTO', 0))
         valor = float(p.get('VALOR', 0))
@@ -81,8 +185,9 @@ def display_products(products: List[Dict], show_all: bool = True):
             p.get('ESTOQUE', '0')
         ]
         
-        widths = [width for _, width in columns]
-        print_table_row(values, widths)
+        rows.append(values)
+    
+    print_table(columns, rows)
 
 
 def display_clients(clients: List[Dict], show_all: bool = True):
@@ -113,9 +218,8 @@ def display_clients(clients: List[Dict], show_all: bool = True):
         ("Telefone", 17)
     ]
     
-    print_table_header(columns)
-    
     # Print rows
+    rows = []
     for c in clients:
         tipo = c.get('TIPO', '').capitalize()
         
@@ -127,8 +231,9 @@ def display_clients(clients: List[Dict], show_all: bool = True):
             c.get('TELEFONE', '')
         ]
         
-        widths = [width for _, width in columns]
-        print_table_row(values, widths)
+        rows.append(values)
+    
+    print_table(columns, rows)
 
 
 def display_sales(sales: List[Dict], show_all: bool = True):
@@ -161,9 +266,13 @@ def display_sales(sales: List[Dict], show_all: bool = True):
         ("Pgto", 10)
     ]
     
-    print_table_header(columns)
+    # Listas grandes: formatação por coluna (NumPy), mesma saída
+    if len(sales) > SALES_VECTORIZE_MIN:
+        _print_sales_table_vectorized(columns, sales)
+        return
     
     # Print rows
+    rows = []
     for s in sales:
         total = float(s.get('PRECO_TOTAL', 0))
         
@@ -177,10 +286,12 @@ def display_sales(sales: List[Dict], show_all: bool = True):
             s.get('MEIO', '').capitalize()[:8]
         ]
         
-        widths = [width for _, width in columns]
-        print_table_row(values, widths)
+        rows.append(values)
+    
+    print_table(columns, rows)
 
 
+@batched_output()
 def display_product_detail(product: Dict):
     """
     Display detailed product information.
@@ -188,9 +299,9 @@ def display_product_detail(product: Dict):
     Args:
         product: Product dictionary
     """
-    print("\n" + "="*60)
+    print("\n" + _SEP60)
     print("  DETALHES DO PRODUTO")
-    print("="*60)
+    print(_SEP60)
     
     custo = float(product.get('CUSTO', 0))
     valor = float(product.get('VALOR', 0))
@@ -208,9 +319,10 @@ def display_product_detail(product: Dict):
     print(f"\nEstoque: {estoque} unidade(s)")
     print(f"Valor em Estoque (custo): R$ {custo * estoque:.2f}")
     print(f"Valor em Estoque (varejo): R$ {valor * estoque:.2f}")
-    print("="*60)
+    print(_SEP60)
 
 
+@batched_output()
 def display_client_detail(client: Dict):
     """
     Display detailed client information.
@@ -218,9 +330,9 @@ def display_client_detail(client: Dict):
     Args:
         client: Client dictionary
     """
-    print("\n" + "="*60)
+    print("\n" + _SEP60)
     print("  DETALHES DO CLIENTE")
-    print("="*60)
+    print(_SEP60)
     
     print(f"\nID: {client.get('ID_CLIENTE', '')}")
     print(f"Nome: {client.get('CLIENTE', '')}")
@@ -243,9 +355,10 @@ def display_client_detail(client: Dict):
     if client.get('ENDERECO'):
         print(f"Endereço: {client.get('ENDERECO', '')}")
     
-    print("="*60)
+    print(_SEP60)
 
 
+@batched_output()
 def display_sale_detail(sale: Dict):
     """
     Display detailed sale information.
@@ -253,9 +366,9 @@ def display_sale_detail(sale: Dict):
     Args:
         sale: Sale dictionary
     """
-    print("\n" + "="*60)
+    print("\n" + _SEP60)
     print("  DETALHES DA VENDA")
-    print("="*60)
+    print(_SEP60)
     
     quantidade = int(sale.get('QUANTIDADE', 0))
     preco_unit = float(sale.get('PRECO_UNIT', 0))
@@ -276,7 +389,7 @@ def display_sale_detail(sale: Dict):
     
     print(f"\nForma de Pagamento: {sale.get('MEIO', '').title()}")
     
-    print("="*60)
+    print(_SEP60)
 
 
 def print_section_header(title: str):
@@ -286,6 +399,6 @@ def print_section_header(title: str):
     Args:
         title: Section title
     """
-    print("\n" + "="*60)
+    print("\n" + _SEP60)
     print(f"  {title}")
-    print("="*60)
\ No newline at end of file
+    print(_SEP60)
\ No newline at end of file
@@ -6,7 +6,12 @@ This module provides the main menu interface for the perfumery management system
 
 import os
 import sys
-from typing import Callable, Dict, Optional
+from typing import Callable, Dict, List, Optional
+
+
+# Limpa a tela e volta o cursor ao topo (sem criar processo 'clear')
+_CLEAR_SCREEN = "\x1b[2J\x1b[H"
+_SEP70 = "=" * 70
 
 
 class Menu:
@@ -14,6 +19,10 @@ class Menu:
     Terminal menu system with navigation and input handling.
     """
     
+    # A tela é uma só para todos os menus (submenus inclusive): indica se
+    # algo foi escrito desde a última limpeza
+    _screen_dirty = True
+    
     def __init__(self, title: str):
         """
         Initialize menu.
@@ -22,8 +31,19 @@ class Menu:
             title: Menu title to display
         """
         self.title = title
-        self.options: Dict[str, tuple[str, Callable]] = {}
+        # Opções em listas paralelas (tecla, descrição, handler) e índice
+        # tecla -> posição para o despacho
+        self._keys: List[str] = []
+        self._descs: List[str] = []
+        self._handlers: List[Callable] = []
+        self._key_to_idx: Dict[str, int] = {}
         self.running = True
+        
+        # Bloco de opções ordenado e tela completa (cabeçalho + opções) já
+        # renderizados; add_option invalida, a tela também depende do título
+        self._options_block: Optional[str] = None
+        self._rendered: Optional[str] = None
+        self._rendered_title: Optional[str] = None
     
     def add_option(self, key: str, description: str, handler: Callable):
         """
@@ -34,25 +54,86 @@ class Menu:
             description: Description to display
             handler: Function to call when selected
         """
-        self.options[key] = (description, handler)
+        idx = self._key_to_idx.get(key)
+        if idx is None:
+            self._key_to_idx[key] = len(self._keys)
+            self._keys.append(key)
+            self._descs.append(description)
+            self._handlers.append(handler)
+        else:
+            # Mesma tecla: substitui, como a atribuição no dict fazia
+            self._descs[idx] = description
+            self._handlers[idx] = handler
+        self._options_block = None
+        self._rendered = None
+    
+    @property
+    def options(self) -> Dict[str, tuple[str, Callable]]:
+        """Options as {key: (description, handler)} (read-only view)."""
+        return {k: (d, h) for k, d, h in zip(self._keys, self._descs, self._handlers)}
     
     def clear_screen(self):
-        """Clear the terminal screen."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        """
+        Clear the terminal screen, unless nothing was written since the
+        last clear (e.g. a handler that opens a submenu right away).
+        """
+        if not Menu._screen_dirty:
+            return
+        if os.name == 'nt':
+            os.system('cls')
+        else:
+            self._write_frame(_CLEAR_SCREEN)
+        Menu._screen_dirty = False
+    
+    @staticmethod
+    def _write_frame(frame: str) -> None:
+        """
+        Write a pre-rendered block of text to the terminal.
+        
+        On a TTY the text is encoded once and written straight to the file
+        descriptor, skipping the TextIOWrapper layer; otherwise (pipes,
+        captured output) it goes through sys.stdout as usual.
+        """
+        out = sys.stdout
+        if not out.isatty():
+            out.write(frame)
+            return
+        
+        out.flush()  # O que já está no buffer sai antes do frame
+        view = memoryview(frame.encode(out.encoding or 'utf-8', errors='replace'))
+        fd = out.fileno()
+        while view:
+            view = view[os.write(fd, view):]
+    
+    def _render_header(self) -> str:
+        """Menu header as a string."""
+        return f"\n{_SEP70}\n  {self.title}\n{_SEP70}\n"
+    
+    def _render_options(self) -> str:
+        """Menu options as a string, sorted once until the next add_option."""
+        if self._options_block is None:
+            lines = "".join(f"  [{key}] {description}\n" for key, description in sorted(zip(self._keys, self._descs)))
+            self._options_block = f"\nOpções:\n{lines}\n"
+        return self._options_block
+    
+    def _render(self) -> str:
+        """
+        Full menu screen (header + options).
+        
+        Reuses the previous render while title and options are unchanged.
+        """
+        if self._rendered is None or self._rendered_title != self.title:
+            self._rendered = self._render_header() + self._render_options()
+            self._rendered_title = self.title
+        return self._rendered
     
     def print_header(self):
         """Print menu header."""
-        width = 70
-        print("\n" + "="*width)
-        print(f"  {self.title}")
-        print("="*width)
+        self._write_frame(self._render_header())
     
     def print_options(self):
         """Print menu options."""
-        print("\nOpções:")
-        for key, (description, _) in sorted(self.options.items()):
-            print(f"  [{key}] {description}")
-        print()
+        self._write_frame(self._render_options())
     
     def get_input(self, prompt: str, allow_empty: bool = False) -> str:
         """
@@ -189,16 +270,17 @@ class Menu:
         while self.running:
             try:
                 self.clear_screen()
-                self.print_header()
-                self.print_options()
+                self._write_frame(self._render())
+                Menu._screen_dirty = True
                 
                 choice = self.get_input("Escolha uma opção: ", allow_empty=True)
                 
                 if not choice:
                     continue
                 
-                if choice in self.options:
-                    _, handler = self.options[choice]
+                idx = self._key_to_idx.get(choice)
+                if idx is not None:
+                    handler = self._handlers[idx]
                     
                     # Clear screen before running handler
                     self.clear_screen()
@@ -212,6 +294,8 @@ class Menu:
                         import traceback
                         traceback.print_exc()
                     
+                    # O handler escreve com print() direto: tela suja
+                    Menu._screen_dirty = True
                     self.pause()
                 else:
                     self.show_warning(f"Opção '{choice}' inválida. Tente novamente.")
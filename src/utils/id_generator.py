@@ -4,9 +4,62 @@ ID generation utilities.
 This module provides functions to generate unique IDs for clients and sales.
 """
 
+import numpy as np
 import pandas as pd
-import re
-from typing import Optional
+from typing import Optional, List
+
+
+def _max_id_number_vectorized(ids, prefix: str) -> int:
+    """
+    Highest number among '<prefix><digits>' IDs in a pandas Series or
+    NumPy array, using pandas string kernels instead of a Python loop.
+    """
+    s = pd.Series(ids, copy=False).astype(str)
+    rest = s[s.str.slice(0, len(prefix)).str.upper() == prefix].str.slice(len(prefix))
+    nums = pd.to_numeric(rest[rest.str.isdecimal()], errors='coerce')
+    max_num = nums.max()
+    return int(max_num) if pd.notna(max_num) else 0
+
+
+def _is_prefixed_id(id_str: str, prefix: str) -> bool:
+    """Whether id_str is prefix (any case) followed only by digits."""
+    n = len(prefix)
+    return id_str[:n].upper() == prefix and id_str[n:].isdecimal()
+
+
+def _scan_max(existing_ids, prefix: str) -> int:
+    """Highest number among the '<prefix><digits>' IDs (0 if none)."""
+    # Coluna do pandas / array: varredura vetorizada
+    if isinstance(existing_ids, (pd.Series, np.ndarray)):
+        return _max_id_number_vectorized(existing_ids, prefix)
+    
+    if not existing_ids:
+        return 0
+    
+    # Maior número entre os IDs existentes, numa única passada
+    n = len(prefix)
+    max_num = 0
+    for id_str in existing_ids:
+        # Prefixo fixo + dígitos (CLI001, VND002...): sem regex; só o
+        # prefixo vai para maiúsculas, não a string inteira
+        s = str(id_str)
+        if s[:n].upper() == prefix and s[n:].isdecimal():
+            num = int(s[n:])
+            if num > max_num:
+                max_num = num
+    return max_num
+
+
+def _generate_id(existing_ids, prefix: str) -> str:
+    """Next '<prefix>NNN' ID after the highest one in existing_ids."""
+    # Format with leading zeros (3 digits)
+    return f"{prefix}{_scan_max(existing_ids, prefix) + 1:03d}"
+
+
+def _generate_ids(existing_ids, prefix: str, n: int) -> List[str]:
+    """n consecutive '<prefix>NNN' IDs after the highest existing one."""
+    max_num = _scan_max(existing_ids, prefix)
+    return [f"{prefix}{max_num + i:03d}" for i in range(1, n + 1)]
 
 
 class IDGenerator:
@@ -18,30 +71,30 @@ class IDGenerator:
         Generate unique client ID in format CLI001, CLI002, etc.
         
         Args:
-            existing_ids: List of existing client IDs
+            existing_ids: List (or pandas Series / NumPy array) of
+                existing client IDs
             
         Returns:
             New unique client ID
         """
-        if not existing_ids:
-            return "CLI001"
-        
-        # Extract numeric parts from existing IDs
-        numbers = []
-        for id_str in existing_ids:
-            # Match pattern like CLI001, CLI002, etc.
-            match = re.search(r'CLI(\d+)', str(id_str).upper())
-            if match:
-                numbers.append(int(match.group(1)))
+        return _generate_id(existing_ids, 'CLI')
+    
+    @staticmethod
+    def generate_client_ids(existing_ids: list, n: int) -> List[str]:
+        """
+        Generate n consecutive unique client IDs in a single pass.
         
-        # Get next number
-        if numbers:
-            next_num = max(numbers) + 1
-        else:
-            next_num = 1
+        Use for batch imports instead of calling generate_client_id()
+        once per client (which rescans the growing ID list every time).
         
-        # Format with leading zeros (3 digits)
-        return f"CLI{next_num:03d}"
+        Args:
+            existing_ids: List of existing client IDs
+            n: Number of IDs to generate
+            
+        Returns:
+            List of n new client IDs (e.g. ['CLI011', 'CLI012', ...])
+        """
+        return _generate_ids(existing_ids, 'CLI', n)
     
     @staticmethod
     def generate_sale_id(existing_ids: list) -> str:
@@ -49,30 +102,30 @@ class IDGenerator:
         Generate unique sale ID in format VND001, VND002, etc.
         
         Args:
-            existing_ids: List of existing sale IDs
+            existing_ids: List (or pandas Series / NumPy array) of
+                existing sale IDs
             
         Returns:
             New unique sale ID
         """
-        if not existing_ids:
-            return "VND001"
-        
-        # Extract numeric parts from existing IDs
-        numbers = []
-        for id_str in existing_ids:
-            # Match pattern like VND001, VND002, etc.
-            match = re.search(r'VND(\d+)', str(id_str).upper())
-            if match:
-                numbers.append(int(match.group(1)))
+        return _generate_id(existing_ids, 'VND')
+    
+    @staticmethod
+    def generate_sale_ids(existing_ids: list, n: int) -> List[str]:
+        """
+        Generate n consecutive unique sale IDs in a single pass.
         
-        # Get next number
-        if numbers:
-            next_num = max(numbers) + 1
-        else:
-            next_num = 1
+        Use for batch imports instead of calling generate_sale_id() once
+        per sale (which rescans the growing ID list every time).
         
-        # Format with leading zeros (3 digits)
-        return f"VND{next_num:03d}"
+        Args:
+            existing_ids: List of existing sale IDs
+            n: Number of IDs to generate
+            
+        Returns:
+            List of n new sale IDs (e.g. ['VND011', 'VND012', ...])
+        """
+        return _generate_ids(existing_ids, 'VND', n)
     
     @staticmethod
     def is_valid_client_id(id_str: str) -> bool:
@@ -88,8 +141,7 @@ class IDGenerator:
         if not id_str:
             return False
         
-        pattern = r'^CLI\d+$'
-        return bool(re.match(pattern, id_str.upper()))
+        return _is_prefixed_id(id_str, 'CLI')
     
     @staticmethod
     def is_valid_sale_id(id_str: str) -> bool:
@@ -105,5 +157,4 @@ class IDGenerator:
         if not id_str:
             return False
         
-        pattern = r'^VND\d+$'
-        return bool(re.match(pattern, id_str.upper()))
\ No newline at end of file
+        return _is_prefixed_id(id_str, 'VND')
\ No newline at end of file
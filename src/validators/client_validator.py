@@ -6,13 +6,121 @@ including CPF/CNPJ format validation and phone number formatting.
 """
 
 import re
+from functools import lru_cache
 from typing import Optional
 
+import numpy as np
+import pandas as pd
+
+
+# Tudo que não é dígito ASCII (limpeza de CPF/CNPJ/telefone)
+_NON_DIGIT = re.compile(r'[^0-9]')
+# Mesma limpeza via str.translate (em C, sem o motor de regex) para texto
+# ASCII, que é o caso normal: tabela que apaga os 118 não-dígitos ASCII
+_ASCII_NON_DIGITS = str.maketrans('', '', ''.join(chr(c) for c in range(128) if not 48 <= c <= 57))
+
+
+# b'0'..b'9' -> 0..9: indexar o resultado dá o valor do dígito sem int()
+_DIGIT_VALUES = bytes.maketrans(b'0123456789', bytes(range(10)))
+
+# Entradas memorizadas por validador/formatador: funções puras da string,
+# chamadas repetidamente com o mesmo valor em importações e formulários
+_CACHE_SIZE = 8192
+
+def _weight_matrix(weights_1, weights_2):
+    """(width, 2) int16 matrix: one column of weights per check digit."""
+    w = np.zeros((len(weights_2) + 1, 2), dtype=np.int16)
+    w[:len(weights_1), 0] = weights_1
+    w[:len(weights_2), 1] = weights_2
+    return w
+
+
+# Pesos dos dígitos verificadores (validação vetorizada). As duas somas
+# saem de um único produto matriz x (largura, 2); em int16 (soma máxima
+# ~1200) em vez de int64, um quarto da memória por operando
+_CPF_WEIGHTS = _weight_matrix(range(10, 1, -1), range(11, 1, -1))
+_CNPJ_WEIGHTS = _weight_matrix([5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2],
+                               [6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2])
+
+
+def digits_only(value: str) -> str:
+    """Keep only the ASCII digits 0-9 of value."""
+    if value.isascii():
+        return value.translate(_ASCII_NON_DIGITS)
+    return _NON_DIGIT.sub('', value)
+
+
+def _digit_matrix(series: pd.Series, width: int):
+    """
+    Clean a Series of documents and pack the ones with exactly `width`
+    digits into an (N, width) matrix of digit values.
+    
+    Returns (mask, matrix): mask marks which rows made it into the matrix.
+    """
+    clean = series.fillna('').astype(str).str.replace(_NON_DIGIT, '', regex=True)
+    mask = (clean.str.len() == width).to_numpy()
+    matrix = (np.frombuffer(''.join(clean[mask]).encode('ascii'), dtype=np.uint8)
+              .reshape(-1, width) - np.uint8(48))
+    return mask, matrix
+
+
+def _check_digits_ok(d, weights):
+    """Row-wise check-digit test for a digit matrix (last two columns)."""
+    # resto < 2 -> 0, senão 11 - resto; os dois dígitos de uma vez
+    r = (d.astype(np.int16) @ weights) % 11
+    ok = (((11 - r) * (r >= 2)) == d[:, -2:]).all(axis=1)
+    # Todos os dígitos iguais é inválido
+    ok &= (d != d[:, :1]).any(axis=1)
+    return ok
+
+
+def _validate_cpf_digits(cpf_clean: str) -> bool:
+    """Check digits of an already-cleaned 11-digit CPF."""
+    # Check if all digits are the same (invalid CPF)
+    if cpf_clean == cpf_clean[0] * 11:
+        return False
+    
+    # CPF validation algorithm: bytes já com o valor de cada dígito, somas
+    # ponderadas escritas por extenso (pesos 10..2 e 11..2)
+    d = cpf_clean.encode('ascii').translate(_DIGIT_VALUES)
+    
+    # Validate first digit (resto < 2 -> 0, senão 11 - resto)
+    r = (d[0]*10 + d[1]*9 + d[2]*8 + d[3]*7 + d[4]*6 + d[5]*5 + d[6]*4 + d[7]*3 + d[8]*2) % 11
+    if (11 - r) * (r >= 2) != d[9]:
+        return False
+    
+    # Validate second digit
+    r = (d[0]*11 + d[1]*10 + d[2]*9 + d[3]*8 + d[4]*7 + d[5]*6 + d[6]*5 + d[7]*4 + d[8]*3 + d[9]*2) % 11
+    return (11 - r) * (r >= 2) == d[10]
+
+
+def _validate_cnpj_digits(cnpj_clean: str) -> bool:
+    """Check digits of an already-cleaned 14-digit CNPJ."""
+    # Check if all digits are the same (invalid CNPJ)
+    if cnpj_clean == cnpj_clean[0] * 14:
+        return False
+    
+    # CNPJ validation algorithm: bytes já com o valor de cada dígito, somas
+    # ponderadas escritas por extenso
+    d = cnpj_clean.encode('ascii').translate(_DIGIT_VALUES)
+    
+    # Weights for first digit: 5 4 3 2 9 8 7 6 5 4 3 2
+    r = (d[0]*5 + d[1]*4 + d[2]*3 + d[3]*2 + d[4]*9 + d[5]*8 + d[6]*7 + d[7]*6
+         + d[8]*5 + d[9]*4 + d[10]*3 + d[11]*2) % 11
+    if (11 - r) * (r >= 2) != d[12]:
+        return False
+    
+    # Weights for second digit: 6 5 4 3 2 9 8 7 6 5 4 3 2
+    r = (d[0]*6 + d[1]*5 + d[2]*4 + d[3]*3 + d[4]*2 + d[5]*9 + d[6]*8 + d[7]*7
+         + d[8]*6 + d[9]*5 + d[10]*4 + d[11]*3 + d[12]*2) % 11
+    return (11 - r) * (r >= 2) == d[13]
+
 
 class ClientValidator:
     """Utility class for client data validation."""
     
     @staticmethod
+    @lru_cache(maxsize=_CACHE_SIZE)
     def validate_cpf(cpf: str) -> bool:
         """
         Validate CPF format (Brazilian individual tax ID).
@@ -29,36 +137,16 @@ class ClientValidator:
             return False
         
         # Remove non-numeric characters
-        cpf_clean = re.sub(r'[^0-9]', '', cpf)
+        cpf_clean = digits_only(cpf)
         
         # CPF must have exactly 11 digits
         if len(cpf_clean) != 11:
             return False
         
-        # Check if all digits are the same (invalid CPF)
-        if cpf_clean == cpf_clean[0] * 11:
-            return False
-        
-        # CPF validation algorithm
-        def calculate_digit(cpf_partial: str, weight: int) -> int:
-            """Calculate verification digit."""
-            total = sum(int(cpf_partial[i]) * (weight - i) for i in range(len(cpf_partial)))
-            remainder = total % 11
-            return 0 if remainder < 2 else 11 - remainder
-        
-        # Validate first digit
-        first_digit = calculate_digit(cpf_clean[:9], 10)
-        if first_digit != int(cpf_clean[9]):
-            return False
-        
-        # Validate second digit
-        second_digit = calculate_digit(cpf_clean[:10], 11)
-        if second_digit != int(cpf_clean[10]):
-            return False
-        
-        return True
+        return _validate_cpf_digits(cpf_clean)
     
     @staticmethod
+    @lru_cache(maxsize=_CACHE_SIZE)
     def validate_cnpj(cnpj: str) -> bool:
         """
         Validate CNPJ format (Brazilian company tax ID).
@@ -75,36 +163,51 @@ class ClientValidator:
             return False
         
         # Remove non-numeric characters
-        cnpj_clean = re.sub(r'[^0-9]', '', cnpj)
+        cnpj_clean = digits_only(cnpj)
         
         # CNPJ must have exactly 14 digits
         if len(cnpj_clean) != 14:
             return False
         
-        # Check if all digits are the same (invalid CNPJ)
-        if cnpj_clean == cnpj_clean[0] * 14:
-            return False
+        return _validate_cnpj_digits(cnpj_clean)
+    
+    @staticmethod
+    def validate_cpf_series(series: pd.Series) -> pd.Series:
+        """
+        Validate a whole column of CPFs at once (bulk imports).
         
-        # CNPJ validation algorithm
-        def calculate_digit(cnpj_partial: str, weights: list) -> int:
-            """Calculate verification digit."""
-            total = sum(int(cnpj_partial[i]) * weights[i] for i in range(len(cnpj_partial)))
-            remainder = total % 11
-            return 0 if remainder < 2 else 11 - remainder
-        
-        # Weights for first digit
-        weights_first = [5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
-        first_digit = calculate_digit(cnpj_clean[:12], weights_first)
-        if first_digit != int(cnpj_clean[12]):
-            return False
+        Same result as calling validate_cpf on each value, but the
+        check digits are computed with NumPy over an (N, 11) matrix.
         
-        # Weights for second digit
-        weights_second = [6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
-        second_digit = calculate_digit(cnpj_clean[:13], weights_second)
-        if second_digit != int(cnpj_clean[13]):
-            return False
+        Args:
+            series: Series of CPF strings (formatted or not)
+            
+        Returns:
+            Boolean Series aligned with the input index
+        """
+        mask, d = _digit_matrix(series, 11)
+        result = np.zeros(len(mask), dtype=bool)
+        result[mask] = _check_digits_ok(d, _CPF_WEIGHTS)
+        return pd.Series(result, index=series.index)
+    
+    @staticmethod
+    def validate_cnpj_series(series: pd.Series) -> pd.Series:
+        """
+        Validate a whole column of CNPJs at once (bulk imports).
         
-        return True
+        Same result as calling validate_cnpj on each value, computed
+        with NumPy over an (N, 14) matrix.
+        
+        Args:
+            series: Series of CNPJ strings (formatted or not)
+            
+        Returns:
+            Boolean Series aligned with the input index
+        """
+        mask, d = _digit_matrix(series, 14)
+        result = np.zeros(len(mask), dtype=bool)
+        result[mask] = _check_digits_ok(d, _CNPJ_WEIGHTS)
+        return pd.Series(result, index=series.index)
     
     @staticmethod
     def validate_cpf_cnpj(value: str, tipo: str) -> tuple[bool, str]:
@@ -121,15 +224,15 @@ class ClientValidator:
         if not value or not value.strip():
             return False, "CPF/CNPJ não pode ser vazio"
         
-        # Remove formatting
-        clean_value = re.sub(r'[^0-9]', '', value)
+        # Remove formatting (uma vez; os validadores de dígitos reusam)
+        clean_value = digits_only(value)
         
         tipo_lower = tipo.lower().strip()
         
         if tipo_lower == 'pessoa':
             # For pessoa, accept CPF (11 digits)
             if len(clean_value) == 11:
-                if ClientValidator.validate_cpf(value):
+                if _validate_cpf_digits(clean_value):
                     return True, ""
                 else:
                     return False, "CPF inválido"
@@ -139,7 +242,7 @@ class ClientValidator:
         elif tipo_lower == 'empresa':
             # For empresa, accept CNPJ (14 digits)
             if len(clean_value) == 14:
-                if ClientValidator.validate_cnpj(value):
+                if _validate_cnpj_digits(clean_value):
                     return True, ""
                 else:
                     return False, "CNPJ inválido"
@@ -149,6 +252,7 @@ class ClientValidator:
         return False, f"Tipo de cliente inválido: {tipo}"
     
     @staticmethod
+    @lru_cache(maxsize=_CACHE_SIZE)
     def format_cpf(cpf: str) -> str:
         """
         Format CPF to standard format: 000.000.000-00
@@ -159,8 +263,12 @@ class ClientValidator:
         Returns:
             Formatted CPF string
         """
+        # Já só dígitos (CSV normalizado): formata sem passar pela limpeza
+        if len(cpf) == 11 and cpf.isascii() and cpf.isdigit():
+            return f"{cpf[:3]}.{cpf[3:6]}.{cpf[6:9]}-{cpf[9:]}"
+        
         # Remove non-numeric characters
-        cpf_clean = re.sub(r'[^0-9]', '', cpf)
+        cpf_clean = digits_only(cpf)
         
         if len(cpf_clean) != 11:
             return cpf  # Return as-is if invalid length
@@ -168,6 +276,7 @@ class ClientValidator:
         return f"{cpf_clean[:3]}.{cpf_clean[3:6]}.{cpf_clean[6:9]}-{cpf_clean[9:]}"
     
     @staticmethod
+    @lru_cache(maxsize=_CACHE_SIZE)
     def format_cnpj(cnpj: str) -> str:
         """
         Format CNPJ to standard format: 00.000.000/0000-00
@@ -178,8 +287,12 @@ class ClientValidator:
         Returns:
             Formatted CNPJ string
         """
+        # Já só dígitos: formata sem passar pela limpeza
+        if len(cnpj) == 14 and cnpj.isascii() and cnpj.isdigit():
+            return f"{cnpj[:2]}.{cnpj[2:5]}.{cnpj[5:8]}/{cnpj[8:12]}-{cnpj[12:]}"
+        
         # Remove non-numeric characters
-        cnpj_clean = re.sub(r'[^0-9]', '', cnpj)
+        cnpj_clean = digits_only(cnpj)
         
         if len(cnpj_clean) != 14:
             return cnpj  # Return as-is if invalid length
@@ -187,6 +300,7 @@ class ClientValidator:
         return f"{cnpj_clean[:2]}.{cnpj_clean[2:5]}.{cnpj_clean[5:8]}/{cnpj_clean[8:12]}-{cnpj_clean[12:]}"
     
     @staticmethod
+    @lru_cache(maxsize=_CACHE_SIZE)
     def format_phone(phone: str) -> str:
         """
         Format Brazilian phone number.
@@ -202,8 +316,12 @@ class ClientValidator:
         if not phone:
             return ""
         
-        # Remove non-numeric characters
-        phone_clean = re.sub(r'[^0-9]', '', phone)
+        # Já só dígitos: pula a limpeza e usa o próprio valor
+        if phone.isascii() and phone.isdigit():
+            phone_clean = phone
+        else:
+            # Remove non-numeric characters
+            phone_clean = digits_only(phone)
         
         if len(phone_clean) == 11:
             # Mobile: (00) 00000-0000
@@ -229,7 +347,7 @@ class ClientValidator:
             return True  # Phone is optional
         
         # Remove non-numeric characters
-        phone_clean = re.sub(r'[^0-9]', '', phone)
+        phone_clean = digits_only(phone)
         
         # Valid lengths: 10 (landline) or 11 (mobile)
         return len(phone_clean) in [10, 11]
\ No newline at end of file
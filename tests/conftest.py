@@ -0,0 +1,34 @@
+import pytest
+from src.models.client import Client
+from src.repositories.base_repository import DB_TYPE
+from src.repositories.client_repository import ClientRepository
+from src.services.product_service import ProductService
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: rescans the database; deselect with -m 'not slow'")
+
+
+@pytest.fixture
+def temp_db(tmp_path, monkeypatch):
+    """Point the SQLite repositories at a fresh, empty database for one test."""
+    if DB_TYPE == 'postgresql':
+        pytest.skip('requires the SQLite backend')
+    from src.database import connection
+
+    db_path = tmp_path / 'test.sqlite3'
+    monkeypatch.setattr(connection, 'DEFAULT_DB', db_path)
+    connection.init_db(db_path=db_path)
+    return db_path
+
+
+@pytest.fixture
+def seeded_db(temp_db):
+    """A temporary database holding the product ABR01 and the client CLI000."""
+    ProductService().ensure_products([
+        {'codigo': 'ABR01', 'produto': 'Produto Teste', 'categoria': 'Teste',
+         'custo': 1.0, 'valor': 2.0, 'estoque': 1000},
+    ])
+    ClientRepository().save(Client(id_cliente='CLI000', cliente='Cliente Teste', vendedor='Teste',
+                                   tipo='pessoa', idade='25-34', genero='Feminino'))
+    return temp_db
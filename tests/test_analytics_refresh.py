@@ -1,36 +1,96 @@
 import pytest
-from datetime import datetime, timedelta
+from datetime import date, timedelta
+from functools import lru_cache
+import numpy as np
 import pandas as pd
 from src.repositories.sale_repository import SaleRepository
 from src.services.sale_service import SaleService
 
 
-def compute_recent_revenue(last_days=365):
-    repo = SaleRepository()
-    df = repo.get_all()
+@pytest.fixture(scope="module")
+def sale_repo():
+    return SaleRepository()
+
+
+@pytest.fixture(scope="module")
+def sale_service(sale_repo):
+    return SaleService(sale_repository=sale_repo)
+
+
+@lru_cache(maxsize=32)
+def _cutoff(day, last_days):
+    # Keyed by the day's ordinal, so it is rebuilt once per calendar day
+    return np.datetime64(date.fromordinal(day) - timedelta(days=last_days), 'ns')
+
+
+def recent_revenue(df, last_days=365, date_col='DATA', value_col='VALOR_TOTAL_VENDA'):
     if df.empty:
         return 0.0
-    df['data_dt'] = pd.to_datetime(df['data'], dayfirst=True, errors='coerce')
-    start_date = datetime.now() - timedelta(days=last_days)
-    recent = df[df['data_dt'] >= pd.Timestamp(start_date)]
-    recent['valor_total_venda'] = pd.to_numeric(recent['valor_total_venda'], errors='coerce').fillna(0)
-    return float(recent['valor_total_venda'].sum())
+    dates, values = df[date_col], df[value_col]
+    # Columns typed by get_all(dtype=, parse_dates=) skip the string conversions
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        # Stored as ISO (SaleRepository.save); legacy rows may still be DD/MM/YYYY
+        raw = dates
+        dates = pd.to_datetime(raw, format='%Y-%m-%d', errors='coerce')
+        dates = dates.fillna(pd.to_datetime(raw, format='%d/%m/%Y', errors='coerce'))
+    if not pd.api.types.is_float_dtype(values):
+        values = pd.to_numeric(values, errors='coerce')
+    dates = dates.to_numpy('datetime64[ns]')
+    values = values.fillna(0).to_numpy()
+    recent = dates >= _cutoff(date.today().toordinal(), last_days)
+    return float(values[recent].sum())
 
 
-def test_monthly_revenue_reflects_new_sale():
-    repo = SaleRepository()
-    ss = SaleService()
+def compute_recent_revenue(repo, last_days=365):
+    # Only the two columns the sum needs come back from the database, already typed
+    df = repo.get_all(columns=['DATA', 'VALOR_TOTAL_VENDA'],
+                      dtype={'VALOR_TOTAL_VENDA': 'float64'}, parse_dates=['DATA'])
+    return recent_revenue(df, last_days)
 
-    before = compute_recent_revenue()
 
-    # Use an existing product and client from fixtures in DB
-    res = ss.register_sale_multi_item(id_cliente='CLI000', meio='pix', items=[{'codigo': 'ABR01', 'quantidade': 1}])
+@pytest.mark.parametrize('date_col, value_col', [
+    ('DATA', 'VALOR_TOTAL_VENDA'),
+    ('data', 'valor_total_venda'),
+])
+def test_recent_revenue_column_conventions(date_col, value_col):
+    today = date.today()
+    df = pd.DataFrame({
+        date_col: [today.strftime('%Y-%m-%d'), today.strftime('%d/%m/%Y'), '2000-01-01', 'invalid'],
+        value_col: ['10.5', 4, 100, 1],
+    })
+    assert recent_revenue(df, date_col=date_col, value_col=value_col) == pytest.approx(14.5)
+
+
+@pytest.mark.slow
+def test_monthly_revenue_reflects_new_sale(seeded_db, sale_repo, sale_service):
+    before = compute_recent_revenue(sale_repo)
+
+    # Product ABR01 and client CLI000 come from the seeded_db fixture
+    res = sale_service.register_sale_multi_item(id_cliente='CLI000', meio='pix', items=[{'codigo': 'ABR01', 'quantidade': 1}])
     assert 'id_venda' in res
     sale_value = res['total_value']
 
-    after = compute_recent_revenue()
+    # Recompute from the database so the persisted row is what gets summed
+    after = compute_recent_revenue(sale_repo)
+
+    assert after == pytest.approx(before + sale_value)
+
+
+def test_get_all_coerces_blank_and_non_numeric_values(temp_db):
+    import sqlite3
+    today = date.today().isoformat()
+    with sqlite3.connect(temp_db) as conn:
+        conn.executemany(
+            'INSERT INTO sales ("ID_VENDA", "CLIENTE", "MEIO", "DATA", "VALOR_TOTAL_VENDA") VALUES (?, ?, ?, ?, ?)',
+            [('VND001', 'A', 'pix', today, 12.5), ('VND002', 'B', 'pix', today, ''),
+             ('VND003', 'C', 'pix', today, 'abc')],
+        )
 
-    # Clean up
-    repo.delete(res['id_venda'])
+    df = SaleRepository().get_all(columns=['ID_VENDA', 'VALOR_TOTAL_VENDA'],
+                                  dtype={'VALOR_TOTAL_VENDA': 'float64'})
 
-    assert after >= before + sale_value - 0.001
+    assert df['VALOR_TOTAL_VENDA'].dtype == 'float64'
+    assert df.sort_values('ID_VENDA')['VALOR_TOTAL_VENDA'].isna().tolist() == [False, True, True]
+    assert recent_revenue(SaleRepository().get_all(
+        columns=['DATA', 'VALOR_TOTAL_VENDA'],
+        dtype={'VALOR_TOTAL_VENDA': 'float64'}, parse_dates=['DATA'])) == pytest.approx(12.5)
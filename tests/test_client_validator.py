@@ -0,0 +1,86 @@
+import random
+
+import pandas as pd
+import pytest
+from src.services.client_service import ClientService
+from src.validators.client_validator import ClientValidator
+
+
+def _with_check_digits(base, weights):
+    digits = [int(ch) for ch in base]
+    for w in weights:
+        r = sum(d * k for d, k in zip(digits, w)) % 11
+        digits.append(0 if r < 2 else 11 - r)
+    return ''.join(map(str, digits))
+
+
+def _cpf(rng):
+    return _with_check_digits(''.join(rng.choices('0123456789', k=9)),
+                              [range(10, 1, -1), range(11, 1, -1)])
+
+
+def _cnpj(rng):
+    return _with_check_digits(''.join(rng.choices('0123456789', k=12)),
+                              [[5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2],
+                               [6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]])
+
+
+def _samples(rng, make, width, fmt):
+    values = ['', '0' * width, '1' * width, 'abc', '123', '9' * (width + 1)]
+    for _ in range(300):
+        doc = make(rng)
+        values.append(doc)
+        values.append(fmt(doc))
+        # Same document with one digit changed: almost always invalid
+        pos = rng.randrange(width)
+        values.append(doc[:pos] + str((int(doc[pos]) + rng.randrange(1, 10)) % 10) + doc[pos + 1:])
+        values.append(''.join(rng.choices('0123456789', k=width)))
+    return values
+
+
+@pytest.mark.parametrize('kind', ['cpf', 'cnpj'])
+def test_series_validators_match_scalar(kind):
+    rng = random.Random(1234)
+    if kind == 'cpf':
+        values = _samples(rng, _cpf, 11, ClientValidator.format_cpf)
+        scalar, series = ClientValidator.validate_cpf, ClientValidator.validate_cpf_series
+    else:
+        values = _samples(rng, _cnpj, 14, ClientValidator.format_cnpj)
+        scalar, series = ClientValidator.validate_cnpj, ClientValidator.validate_cnpj_series
+
+    index = pd.RangeIndex(100, 100 + len(values))
+    result = series(pd.Series(values, index=index))
+
+    assert result.index.equals(index)
+    assert result.tolist() == [scalar(v) for v in values]
+    assert result.any() and not result.all()
+
+
+def test_series_validators_treat_missing_as_invalid():
+    s = pd.Series([None, float('nan'), '529.982.247-25'])
+    assert ClientValidator.validate_cpf_series(s).tolist() == [False, False, True]
+
+
+def _client(nome, tipo, cpf_cnpj):
+    extra = {'idade': '25-34', 'genero': 'Feminino'} if tipo == 'pessoa' else {'endereco': 'Rua A, 1'}
+    return {'cliente': nome, 'vendedor': 'Teste', 'tipo': tipo, 'cpf_cnpj': cpf_cnpj, **extra}
+
+
+def test_register_clients_bulk_validates_documents(temp_db):
+    service = ClientService()
+    saved = service.register_clients_bulk([
+        _client('Ana', 'pessoa', '52998224725'),
+        _client('Loja', 'empresa', '11222333000181'),
+        _client('Bia', 'pessoa', ''),
+    ])
+
+    assert [c.cpf_cnpj for c in saved] == ['529.982.247-25', '11.222.333/0001-81', '']
+
+    # A CNPJ given for a 'pessoa' fails with the per-value message
+    with pytest.raises(ValueError, match='CPF deve ter 11 dígitos'):
+        service.register_clients_bulk([_client('Caio', 'pessoa', '39053344705'),
+                                       _client('Davi', 'pessoa', '11222333000181')])
+    with pytest.raises(ValueError, match='CNPJ inválido'):
+        service.register_clients_bulk([_client('Outra', 'empresa', '11222333000182')])
+
+    assert len(service.repository.find_all(columns=['ID_CLIENTE'])) == 3
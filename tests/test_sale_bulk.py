@@ -0,0 +1,134 @@
+import sqlite3
+
+import pytest
+from src.models.client import Client
+from src.models.product import Product
+from src.models.sale import Sale
+from src.repositories.client_repository import ClientRepository
+from src.repositories.product_repository import ProductRepository
+from src.repositories.sale_repository import SaleRepository
+from src.services.sale_service import SaleService
+
+
+@pytest.fixture
+def service(temp_db):
+    ClientRepository().save(Client(id_cliente='CLI001', cliente='Cliente Bulk', vendedor='Teste',
+                                   tipo='pessoa', idade='25-34', genero='Feminino'))
+    products = ProductRepository()
+    products.save(Product(codigo='P1', produto='Produto Um', categoria='Teste', custo=1.0, valor=10.0, estoque=5))
+    products.save(Product(codigo='P2', produto='Produto Dois', categoria='Teste', custo=1.0, valor=4.0, estoque=10))
+    return SaleService()
+
+
+def _rows(db_path, sql):
+    with sqlite3.connect(str(db_path)) as conn:
+        return conn.execute(sql).fetchall()
+
+
+def _stocks(db_path):
+    return dict(_rows(db_path, 'SELECT "CODIGO", "ESTOQUE" FROM products'))
+
+
+def _sale(codigo, quantidade, meio='pix'):
+    return {'id_cliente': 'CLI001', 'meio': meio, 'items': [{'codigo': codigo, 'quantidade': quantidade}]}
+
+
+def test_register_sales_bulk_saves_everything(service, temp_db):
+    results = service.register_sales_bulk([_sale('P1', 2), _sale('P2', 3), _sale('p1', 1)])
+
+    assert [r['id_venda'] for r in results] == ['VND001', 'VND002', 'VND003']
+    assert [r['total_value'] for r in results] == [20.0, 12.0, 10.0]
+    assert _rows(temp_db, 'SELECT COUNT(*) FROM sales_items') == [(3,)]
+    assert _stocks(temp_db) == {'P1': 2, 'P2': 7}
+
+
+def test_register_sales_bulk_rejects_combined_demand_over_stock(service, temp_db):
+    # Each sale fits the stock of P1 (5) on its own; together they do not
+    with pytest.raises(ValueError, match='Estoque insuficiente'):
+        service.register_sales_bulk([_sale('P1', 3), _sale('P1', 3)])
+
+    assert _rows(temp_db, 'SELECT COUNT(*) FROM sales') == [(0,)]
+    assert _stocks(temp_db) == {'P1': 5, 'P2': 10}
+
+
+def test_register_sales_bulk_invalid_sale_saves_nothing(service, temp_db):
+    with pytest.raises(ValueError, match='Meio de pagamento'):
+        service.register_sales_bulk([_sale('P1', 1), _sale('P2', 1, meio='escambo'), _sale('P2', 1)])
+
+    assert _rows(temp_db, 'SELECT COUNT(*) FROM sales') == [(0,)]
+    assert _stocks(temp_db) == {'P1': 5, 'P2': 10}
+
+
+def test_register_sales_bulk_write_failure_rolls_back(service, temp_db, monkeypatch):
+    save = SaleRepository.save
+    calls = []
+
+    def failing_save(repo, sale):
+        calls.append(sale.id_venda)
+        if len(calls) == 2:
+            raise RuntimeError('disk full')
+        return save(repo, sale)
+
+    monkeypatch.setattr(SaleRepository, 'save', failing_save)
+    with pytest.raises(Exception, match='disk full'):
+        service.register_sales_bulk([_sale('P1', 1), _sale('P2', 1), _sale('P2', 1)])
+
+    assert calls == ['VND001', 'VND002']
+    assert _rows(temp_db, 'SELECT COUNT(*) FROM sales') == [(0,)]
+    assert _rows(temp_db, 'SELECT COUNT(*) FROM sales_items') == [(0,)]
+    assert _stocks(temp_db) == {'P1': 5, 'P2': 10}
+
+
+def test_register_sales_bulk_ids_follow_max_sale_id(service):
+    SaleRepository().save(Sale(id_venda='VND007', id_cliente='CLI001', cliente='Cliente Bulk',
+                               meio='pix', data='01/01/2024', valor_total_venda=1.0))
+    assert service.sale_repository.get_max_sale_id() == 'VND007'
+
+    results = service.register_sales_bulk([_sale('P1', 1), _sale('P2', 1), _sale('P2', 2)])
+
+    assert [r['id_venda'] for r in results] == ['VND008', 'VND009', 'VND010']
+    assert service.sale_repository.get_max_sale_id() == 'VND010'
+
+
+def test_get_max_sale_id_ignores_non_numeric_suffixes(service):
+    repo = service.sale_repository
+    for id_venda in ('VND005', 'VND12abc', 'VND9-1', 'vnd004'):
+        repo.save(Sale(id_venda=id_venda, id_cliente='CLI001', cliente='Cliente Bulk',
+                       meio='pix', data='01/01/2024', valor_total_venda=1.0))
+
+    assert repo.get_max_sale_id() == 'VND005'
+
+
+def test_cancel_sales_bulk_missing_id_cancels_nothing(service, temp_db):
+    service.register_sales_bulk([_sale('P1', 2), _sale('P2', 3)])
+
+    with pytest.raises(ValueError, match='VND999'):
+        service.cancel_sales_bulk(['VND001', 'VND999'])
+
+    assert _rows(temp_db, 'SELECT COUNT(*) FROM sales') == [(2,)]
+    assert _rows(temp_db, 'SELECT COUNT(*) FROM sales_items') == [(2,)]
+    assert _stocks(temp_db) == {'P1': 3, 'P2': 7}
+
+
+def test_cancel_sales_bulk_restores_stock_once_per_item(service, temp_db):
+    multi = {'id_cliente': 'CLI001', 'meio': 'pix',
+             'items': [{'codigo': 'P1', 'quantidade': 2}, {'codigo': 'P2', 'quantidade': 3}]}
+    service.register_sales_bulk([multi, _sale('P1', 1), _sale('P2', 4)])
+    assert _stocks(temp_db) == {'P1': 2, 'P2': 3}
+
+    # Repeated IDs in the input must not restore the same items twice
+    assert service.cancel_sales_bulk(['VND001', 'VND002', 'VND001']) == 2
+
+    assert _rows(temp_db, 'SELECT "ID_VENDA" FROM sales') == [('VND003',)]
+    assert _rows(temp_db, 'SELECT "ID_VENDA" FROM sales_items') == [('VND003',)]
+    assert _stocks(temp_db) == {'P1': 5, 'P2': 6}
+
+
+def test_cancel_sales_bulk_without_restoring_stock(service, temp_db):
+    service.register_sales_bulk([_sale('P1', 2), _sale('P2', 3)])
+
+    assert service.cancel_sales_bulk(['VND001', 'VND002'], restore_stock=False) == 2
+
+    assert _rows(temp_db, 'SELECT COUNT(*) FROM sales') == [(0,)]
+    assert _rows(temp_db, 'SELECT COUNT(*) FROM sales_items') == [(0,)]
+    assert _stocks(temp_db) == {'P1': 3, 'P2': 7}
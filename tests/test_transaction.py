@@ -0,0 +1,74 @@
+import sqlite3
+import threading
+
+import pytest
+from src.models.product import Product
+from src.repositories.product_repository import ProductRepository
+from src.repositories.sale_repository import SaleRepository
+
+
+def _product(codigo):
+    return Product(codigo=codigo, produto='Produto', categoria='Teste', custo=1.0, valor=2.0, estoque=10)
+
+
+def _codes(db_path):
+    # Separate connection: sees only what has been committed
+    with sqlite3.connect(str(db_path)) as conn:
+        return sorted(r[0] for r in conn.execute('SELECT "CODIGO" FROM products'))
+
+
+def test_nested_blocks_commit_once_at_outer_exit(temp_db):
+    repo = ProductRepository()
+    with repo.transaction():
+        repo.save(_product('T1'))
+        # Another repository joins the same transaction
+        with SaleRepository().transaction():
+            repo.save(_product('T2'))
+        assert _codes(temp_db) == []
+        assert repo.exists('T2')
+    assert _codes(temp_db) == ['T1', 'T2']
+    assert not repo._in_transaction()
+
+
+def test_exception_in_nested_block_rolls_back_outer(temp_db):
+    repo = ProductRepository()
+    with pytest.raises(RuntimeError):
+        with repo.transaction():
+            repo.save(_product('T1'))
+            with repo.transaction():
+                repo.save(_product('T2'))
+                raise RuntimeError('boom')
+    assert _codes(temp_db) == []
+    assert not repo._in_transaction()
+
+
+def test_exception_after_nested_block_discards_its_writes(temp_db):
+    repo = ProductRepository()
+    with pytest.raises(RuntimeError):
+        with repo.transaction():
+            with repo.transaction():
+                repo.save(_product('T1'))
+            raise RuntimeError('boom')
+    assert _codes(temp_db) == []
+
+
+def test_begin_immediate_takes_write_lock_on_entry(temp_db):
+    repo = ProductRepository()
+    with repo.transaction():
+        other = sqlite3.connect(str(temp_db), timeout=0)
+        try:
+            with pytest.raises(sqlite3.OperationalError, match='locked'):
+                other.execute('INSERT INTO products ("CODIGO") VALUES (\'X1\')')
+        finally:
+            other.close()
+
+
+def test_transaction_is_per_thread(temp_db):
+    repo = ProductRepository()
+    seen = []
+    with repo.transaction():
+        worker = threading.Thread(target=lambda: seen.append(repo._in_transaction()))
+        worker.start()
+        worker.join()
+        assert repo._in_transaction()
+    assert seen == [False]
@@ -0,0 +1,41 @@
+import os
+from io import BytesIO
+
+import pytest
+from src.services.visualization_service import VisualizationService
+
+PAYMENTS = {'payment_methods': [
+    {'payment_method': 'pix', 'revenue': 120.0, 'transaction_count': 3},
+    {'payment_method': 'dinheiro', 'revenue': 40.0, 'transaction_count': 2},
+]}
+CATEGORIES = {'categories': [
+    {'category': 'Aromas', 'revenue': 80.0},
+    {'category': 'Velas', 'revenue': 20.0},
+]}
+
+
+@pytest.fixture
+def viz(tmp_path):
+    return VisualizationService(output_dir=str(tmp_path))
+
+
+def test_buffer_rejects_several_formats(viz):
+    with pytest.raises(ValueError, match='único formato'):
+        viz.plot_payment_methods(PAYMENTS, save=BytesIO(), file_format=('png', 'pdf'))
+    with pytest.raises(ValueError, match='único formato'):
+        viz._write_svg('<svg/>', BytesIO(), 'x', ('svg', 'png'))
+
+
+def test_buffer_and_file_outputs(viz, tmp_path):
+    buf = BytesIO()
+    assert viz.plot_payment_methods(PAYMENTS, save=buf, file_format=('pdf',)) is buf
+    assert buf.getvalue().startswith(b'%PDF')
+
+    paths = viz.plot_payment_methods(PAYMENTS, file_format=('png', 'pdf'))
+    assert [os.path.splitext(p)[1] for p in paths] == ['.png', '.pdf']
+    assert all(os.path.dirname(p) == str(tmp_path) and os.path.exists(p) for p in paths)
+
+    svg = BytesIO()
+    assert viz.plot_category_distribution(CATEGORIES, save=svg, file_format='svg') is svg
+    assert svg.getvalue().startswith(b'<svg')
+    assert viz.plot_payment_methods({'payment_methods': []}) is None